@@ -1,15 +1,18 @@
 from flask import Flask
 from flask_cors import CORS
+from sqlalchemy.orm import configure_mappers
 
 from app.api import register_blueprints
 from app.extensions import db, jwt, redis_client, celery_app
 from app.config import Config
 from app.extentions.celery_extention import init_celery
+from app.utils.json_provider import OrjsonProvider
 
 
 def create_app():
     """Application factory pattern"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     app.config.from_object(Config)
@@ -26,18 +29,19 @@ def create_app():
     # Register blueprints
     register_blueprints(app)
 
+    # Resolve model relationships now rather than on the first query
+    configure_mappers()
+
     # Error handlers
     register_error_handlers(app)
 
     return app
 
-def register_error_handlers(appk):
+def register_error_handlers(app):
     from flask import jsonify
     from app.errors.exceptions import AppError
 
-    @appk.errorhandler(AppError)
+    @app.errorhandler(AppError)
     def handle_app_error(error):
-        return jsonify({
-            "error": error.error,
-            "message": error.message
-        }), error.status_code
\ No newline at end of file
+        body, status_code = error.to_response()
+        return jsonify(body), status_code
\ No newline at end of file
@@ -3,7 +3,6 @@ API Blueprints Package
 Registers all API blueprints
 """
 
-from flask import Blueprint
 from app.api.payments import payments_bp
 from app.api.webhooks import webhooks_bp
 from app.api.admin import admin_bp
@@ -23,6 +22,17 @@ __all__ = [
 ]
 
 
+# Blueprint -> URL prefix, in registration order
+_PREFIXES = (
+    (payments_bp, '/api/v1/payments'),
+    (webhooks_bp, '/api/v1/webhooks'),
+    (admin_bp, '/api/v1/admin'),
+    (health_bp, '/api/v1/health'),
+    (auth_bp, '/api/v1/auth'),
+    (admin_dashboard_bp, '/api/v1/'),
+)
+
+
 def register_blueprints(app):
     """
     Register all blueprints with the Flask app
@@ -30,12 +40,5 @@ def register_blueprints(app):
     Args:
         app: Flask application instance
     """
-
-    url_base : str = '/api/v1'
-
-    app.register_blueprint(payments_bp, url_prefix=f'{url_base}/payments')
-    app.register_blueprint(webhooks_bp, url_prefix=f"{url_base}/webhooks")
-    app.register_blueprint(admin_bp, url_prefix=f'{url_base}/admin')
-    app.register_blueprint(health_bp, url_prefix=f'{url_base}/health')
-    app.register_blueprint(auth_bp, url_prefix=f'{url_base}/auth')
-    app.register_blueprint(admin_dashboard_bp, url_prefix=f'{url_base}/')
\ No newline at end of file
+    for blueprint, url_prefix in _PREFIXES:
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
@@ -3,18 +3,49 @@ Admin API Endpoints
 Administrative functions for managing the payment gateway
 """
 
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import Blueprint, request, jsonify, Response, current_app
+from sqlalchemy import func
 
 from app.providers import list_available_providers, get_provider
-from app.services.payment_service import PaymentService
 from app.services.audit_service import AuditService
 from app.services.webhook_service import WebhookService
-from app.models import ProviderConfig
-from app.extensions import db
+from app.models import ProviderConfig, ProviderTable, Transaction
+from app.extensions import db, redis_client
+from app.tasks.reconcile_transactions_task import reconcile_transactions as reconcile_transactions_task
+from app.utils.clock import db_now
+from app.utils.jwt_cache import jwt_required_cached
 
 admin_bp = Blueprint('admin', __name__)
 
+# Dashboards poll statistics far more often than the numbers move
+STATISTICS_CACHE_TTL = 30
+
+# Workers for the independent statistics queries
+_stats_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='admin-stats')
+
+
+def _in_app_context(app, fn, *args, **kwargs):
+    """Run fn inside its own app context (and so its own DB session)"""
+    with app.app_context():
+        return fn(*args, **kwargs)
+
+
+def _provider_statistics(start_date, end_date):
+    """Completed transaction count and volume per provider"""
+    return db.session.query(
+        Transaction.provider,
+        func.count(Transaction.id).label('count'),
+        func.sum(Transaction.amount).label('volume')
+    ).filter(
+        Transaction.created_at >= start_date,
+        Transaction.created_at <= end_date,
+        Transaction.status == 'completed'
+    ).group_by(Transaction.provider).all()
+
 
 @admin_bp.route('/providers', methods=['GET'])
 def get_providers():
@@ -27,23 +58,29 @@ def get_providers():
     try:
         providers = list_available_providers()
 
-        # Get provider configurations from database
-        # configs = ProviderConfig.query.all()
-        # config_dict = {config.provider_name: config for config in configs}
-        #
-        # provider_list = []
-        # for provider in providers:
-        #     config = config_dict.get(provider)
-        #     provider_list.append({
-        #         'name': provider,
-        #         'is_configured': config is not None,
-        #         'is_active': config.is_active if config else False,
-        #         'last_updated': config.updated_at.isoformat() if config else None
-        #     })
+        # Get provider configurations from database, one row per provider
+        rows = db.session.query(
+            ProviderTable.name,
+            func.bool_or(ProviderConfig.is_active).label('is_active'),
+            func.max(ProviderConfig.updated_at).label('updated_at')
+        ).join(
+            ProviderConfig, ProviderConfig.provider_id == ProviderTable.id
+        ).group_by(ProviderTable.name).all()
+        config_dict = {row.name: row for row in rows}
+
+        provider_list = []
+        for provider in providers:
+            config = config_dict.get(provider)
+            provider_list.append({
+                'name': provider,
+                'is_configured': config is not None,
+                'is_active': bool(config.is_active) if config else False,
+                'last_updated': config.updated_at.isoformat() if config else None
+            })
 
         return jsonify({
             'success': True,
-            'data': providers
+            'data': provider_list
         }), 200
 
     except Exception as e:
@@ -52,6 +89,7 @@ def get_providers():
             'error': str(e)
         }), 500
 
+
 @admin_bp.route('/statistics', methods=['GET'])
 def get_statistics():
     """
@@ -62,67 +100,69 @@ def get_statistics():
         - end_date: End date (ISO format)
     """
     try:
-        from datetime import datetime, timedelta
-        from sqlalchemy import func
-        from app.models import Transaction
-
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
 
+        # Key on the raw arguments: the defaults move with the clock
+        cache_key = f"stats:{start_date or ''}:{end_date or ''}"
+
+        try:
+            cached = redis_client.get(cache_key)
+            if cached:
+                return Response(cached, mimetype='application/json'), 200
+        except Exception as e:
+            current_app.logger.warning(f'Statistics cache retrieval failed: {str(e)}')
+
         if start_date:
             start_date = datetime.fromisoformat(start_date)
         else:
-            start_date = datetime.now() - timedelta(days=30)
+            start_date = db_now() - timedelta(days=30)
 
         if end_date:
             end_date = datetime.fromisoformat(end_date)
         else:
-            end_date = datetime.now()
+            end_date = db_now()
 
-        # Transaction statistics
-        query = Transaction.query.filter(
-            Transaction.created_at >= start_date,
-            Transaction.created_at <= end_date
+        # The remaining queries are independent, run them alongside this one
+        app = current_app._get_current_object()
+        provider_future = _stats_executor.submit(
+            _in_app_context, app, _provider_statistics, start_date, end_date
+        )
+        webhook_future = _stats_executor.submit(
+            _in_app_context, app, WebhookService.get_webhook_statistics,
+            start_date=start_date, end_date=end_date
+        )
+        audit_future = _stats_executor.submit(
+            _in_app_context, app, AuditService.get_event_statistics,
+            start_date=start_date, end_date=end_date
         )
 
-        total_transactions = query.count()
-        completed_transactions = query.filter_by(status='completed').count()
-        failed_transactions = query.filter_by(status='failed').count()
-        pending_transactions = query.filter_by(status='pending').count()
-
-        # Total volume
-        total_volume = db.session.query(
+        # Transaction statistics, one row per status
+        status_rows = db.session.query(
+            Transaction.status,
+            func.count(Transaction.id),
             func.sum(Transaction.amount)
         ).filter(
-            Transaction.created_at >= start_date,
-            Transaction.created_at <= end_date,
-            Transaction.status == 'completed'
-        ).scalar() or 0
-
-        # By provider
-        provider_stats = db.session.query(
-            Transaction.provider,
-            func.count(Transaction.id).label('count'),
-            func.sum(Transaction.amount).label('volume')
-        ).filter(
-            Transaction.created_at >= start_date,
-            Transaction.created_at <= end_date,
-            Transaction.status == 'completed'
-        ).group_by(Transaction.provider).all()
+            Transaction.created_at.between(start_date, end_date)
+        ).group_by(Transaction.status).all()
 
-        # Webhook statistics
-        webhook_stats = WebhookService.get_webhook_statistics(
-            start_date=start_date,
-            end_date=end_date
-        )
+        counts = {status: count for status, count, _ in status_rows}
 
-        # Audit event statistics
-        audit_stats = AuditService.get_event_statistics(
-            start_date=start_date,
-            end_date=end_date
-        )
+        total_transactions = sum(counts.values())
+        completed_transactions = counts.get('completed', 0)
+        failed_transactions = counts.get('failed', 0)
+        pending_transactions = counts.get('pending', 0)
 
-        return jsonify({
+        # Total volume
+        total_volume = next(
+            (volume for status, _, volume in status_rows if status == 'completed'), 0
+        ) or 0
+
+        provider_stats = provider_future.result()
+        webhook_stats = webhook_future.result()
+        audit_stats = audit_future.result()
+
+        response = jsonify({
             'success': True,
             'data': {
                 'period': {
@@ -149,7 +189,14 @@ def get_statistics():
                 'webhooks': webhook_stats,
                 'audit_events': audit_stats
             }
-        }), 200
+        })
+
+        try:
+            redis_client.set(cache_key, response.get_data(), ex=STATISTICS_CACHE_TTL)
+        except Exception as e:
+            current_app.logger.warning(f'Statistics cache storage failed: {str(e)}')
+
+        return response, 200
 
     except Exception as e:
         return jsonify({
@@ -159,41 +206,59 @@ def get_statistics():
 
 
 @admin_bp.route('/transactions/reconcile', methods=['POST'])
-@jwt_required()
+@jwt_required_cached()
 def reconcile_transactions():
     """
     Reconcile pending transactions with payment providers
 
-    Verifies the status of all pending transactions
+    Queues verification of all pending transactions and returns the job ID
+    immediately; poll GET /transactions/reconcile/<task_id> for the outcome.
     """
     try:
-        from app.models import Transaction
-
-        # Get all pending or processing transactions
-        pending_transactions = Transaction.query.filter(
-            Transaction.status.in_(['pending', 'processing'])
-        ).all()
-
-        reconciled = 0
-        errors = []
-
-        for transaction in pending_transactions:
-            try:
-                PaymentService.verify_payment(transaction.id)
-                reconciled += 1
-            except Exception as e:
-                errors.append({
-                    'transaction_id': str(transaction.id),
-                    'error': str(e)
-                })
+        task = reconcile_transactions_task.delay()
 
         return jsonify({
             'success': True,
             'data': {
-                'total_pending': len(pending_transactions),
-                'reconciled': reconciled,
-                'errors': errors
+                'task_id': task.id,
+                'status': 'queued'
             }
+        }), 202
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@admin_bp.route('/transactions/reconcile/<task_id>', methods=['GET'])
+@jwt_required_cached()
+def get_reconcile_status(task_id):
+    """
+    Get the status of a reconciliation job
+
+    Path Parameters:
+        task_id: ID returned when the job was queued
+    """
+    try:
+        result = reconcile_transactions_task.AsyncResult(task_id)
+
+        data = {
+            'task_id': task_id,
+            'status': result.state.lower()
+        }
+
+        if result.successful():
+            data['result'] = result.result
+        elif result.failed():
+            data['error'] = str(result.result)
+        elif isinstance(result.info, dict):
+            data['progress'] = result.info
+
+        return jsonify({
+            'success': True,
+            'data': data
         }), 200
 
     except Exception as e:
@@ -204,7 +269,7 @@ def reconcile_transactions():
 
 
 @admin_bp.route('/webhooks/retry-failed', methods=['POST'])
-@jwt_required()
+@jwt_required_cached()
 def retry_failed_webhooks():
     """
     Manually trigger retry of all failed webhooks
@@ -228,7 +293,7 @@ def retry_failed_webhooks():
 
 
 @admin_bp.route('/audit-logs', methods=['GET'])
-@jwt_required()
+@jwt_required_cached()
 def get_audit_logs():
     """
     Get audit logs with filters
@@ -241,16 +306,16 @@ def get_audit_logs():
         - end_date: End date (ISO format)
         - page: Page number (default: 1)
         - per_page: Items per page (default: 50)
+        - cursor: Keyset cursor from a previous response's next_cursor;
+          when present, page is ignored and no totals are computed
     """
     try:
-        from datetime import datetime
-        import uuid as uuid_module
-
         transaction_id = request.args.get('transaction_id')
         event_type = request.args.get('event_type')
         user_id = request.args.get('user_id')
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
+        cursor = request.args.get('cursor')
         page = int(request.args.get('page', 1))
         per_page = min(int(request.args.get('per_page', 50)), 100)
 
@@ -263,7 +328,30 @@ def get_audit_logs():
 
         # Parse transaction_id
         if transaction_id:
-            transaction_id = uuid_module.UUID(transaction_id)
+            transaction_id = uuid.UUID(transaction_id)
+
+        if cursor is not None:
+            logs, next_cursor = AuditService.get_audit_logs_after(
+                cursor=cursor,
+                transaction_id=transaction_id,
+                event_type=event_type,
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                per_page=per_page
+            )
+
+            return jsonify({
+                'success': True,
+                'data': {
+                    'items': [dict(row._mapping) for row in logs],
+                    'pagination': {
+                        'per_page': per_page,
+                        'has_next': next_cursor is not None,
+                        'next_cursor': next_cursor
+                    }
+                }
+            }), 200
 
         pagination = AuditService.get_audit_logs(
             transaction_id=transaction_id,
@@ -278,18 +366,28 @@ def get_audit_logs():
         return jsonify({
             'success': True,
             'data': {
-                'items': [log.to_dict() for log in pagination.items],
+                'items': [dict(row._mapping) for row in pagination.items],
                 'pagination': {
                     'page': pagination.page,
                     'per_page': pagination.per_page,
                     'total': pagination.total,
                     'pages': pagination.pages,
                     'has_next': pagination.has_next,
-                    'has_prev': pagination.has_prev
+                    'has_prev': pagination.has_prev,
+                    'next_cursor': (
+                        AuditService.encode_cursor(pagination.items[-1])
+                        if pagination.has_next and pagination.items else None
+                    )
                 }
             }
         }), 200
 
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -5,18 +5,31 @@ All routes are guarded — unauthenticated users are redirected to /admin/login.
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from requests.adapters import HTTPAdapter
 from flask import (
     Blueprint, render_template, request, redirect,
-    url_for, session, flash, current_app
+    url_for, session, flash, current_app, g
 )
 
+from app.utils.jwt_cache import invalidate_token
+
 admin_dashboard_bp = Blueprint(
     'admin_dashboard',
     __name__,
     template_folder='../templates'
 )
 
+# Shared HTTP session so keep-alive connections to the API are reused
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32)
+_session = requests.Session()
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Workers for pages that fan out to several API endpoints at once
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='admin-api')
+
 # Auth guard decorator
 
 def login_required(f):
@@ -30,19 +43,42 @@ def login_required(f):
     return decorated
 
 
-def _api(path, method='GET', json=None, params=None):
+def _build_api_context():
     """
-    Internal helper: call the payment-gateway API using the token stored in the
-    current admin session.  Returns the parsed JSON response dict (or an empty
-    dict on error).
+    Resolve the API base URL and request headers for the current admin session.
+    Must be called from the request thread.
     """
     base = current_app.config.get('API_BASE_URL', 'http://127.0.0.1:5000/api/v1')
     headers = {
         'Authorization': f"Bearer {session.get('admin_token', '')}",
         'Content-Type': 'application/json',
     }
+    return base, headers
+
+
+@admin_dashboard_bp.before_request
+def _prepare_api_context():
+    """Build the API base URL and headers once per authenticated request."""
+    if 'admin_token' in session:
+        g.api_base, g.api_headers = _build_api_context()
+
+
+def _api_context():
+    """Return the per-request API base URL and headers."""
+    if 'api_headers' not in g:
+        g.api_base, g.api_headers = _build_api_context()
+    return g.api_base, g.api_headers
+
+
+def _api(path, method='GET', json=None, params=None):
+    """
+    Internal helper: call the payment-gateway API using the token stored in the
+    current admin session.  Returns the parsed JSON response dict (or an empty
+    dict on error).
+    """
+    base, headers = _api_context()
     try:
-        resp = requests.request(
+        resp = _session.request(
             method,
             f"{base}{path}",
             headers=headers,
@@ -56,6 +92,38 @@ def _api(path, method='GET', json=None, params=None):
         return {'success': False, 'error': str(exc)}
 
 
+def _api_many(*calls):
+    """
+    Internal helper: issue several GET calls to the API concurrently.
+
+    Args:
+        calls: (path, params) tuples
+
+    Returns:
+        List of parsed JSON response dicts, in the order the calls were given
+    """
+    base, headers = _api_context()
+    futures = [
+        _executor.submit(
+            _session.get,
+            f"{base}{path}",
+            headers=headers,
+            params=params,
+            timeout=10,
+        )
+        for path, params in calls
+    ]
+
+    results = []
+    for (path, _), future in zip(calls, futures):
+        try:
+            results.append(future.result().json())
+        except Exception as exc:
+            current_app.logger.error(f"API call failed [GET {path}]: {exc}")
+            results.append({'success': False, 'error': str(exc)})
+    return results
+
+
 # Auth routes
 
 @admin_dashboard_bp.route('/login', methods=['GET', 'POST'])
@@ -72,7 +140,7 @@ def login():
         # Exchange credentials for a JWT via the existing auth endpoint.
         base = current_app.config.get('API_BASE_URL', 'http://localhost:5000/api/v1/')
         try:
-            resp = requests.post(
+            resp = _session.post(
                 f"{base}/auth/admin/login",
                 json={'username': username, 'password': password},
                 timeout=10,
@@ -95,6 +163,8 @@ def login():
 @admin_dashboard_bp.route('/logout')
 def logout():
     """Clear the admin session and redirect to login."""
+    if 'admin_token' in session:
+        invalidate_token(session['admin_token'])
     session.clear()
     flash('You have been logged out.', 'info')
     return redirect(url_for('admin_dashboard.login'))
@@ -106,9 +176,11 @@ def logout():
 @login_required
 def dashboard():
     """Main overview dashboard — statistics + recent transactions."""
-    stats = _api('/admin/statistics')
-    health = _api('/health')
-    providers = _api('/admin/providers')
+    stats, health, providers = _api_many(
+        ('/admin/statistics', None),
+        ('/health', None),
+        ('/admin/providers', None),
+    )
 
     context = {
         'page': 'dashboard',
@@ -166,7 +238,8 @@ def reconcile():
     """Trigger reconciliation of pending transactions."""
     result = _api('/admin/transactions/reconcile', method='POST')
     flash(
-        f"Reconciled {result.get('data', {}).get('reconciled', 0)} transactions.",
+        f"Reconciliation queued (job {result.get('data', {}).get('task_id', '-')})."
+        if result.get('success') else 'Could not queue reconciliation.',
         'success' if result.get('success') else 'danger'
     )
     return redirect(url_for('admin_dashboard.transactions'))
@@ -188,9 +261,11 @@ def webhooks():
     if processed:  params['processed'] = processed
     if verified:   params['verified'] = verified
 
-    events = _api('/webhooks/events', params=params)
-    dlq    = _api('/webhooks/dead-letter-queue')
-    stats  = _api('/webhooks/statistics')
+    events, dlq, stats = _api_many(
+        ('/webhooks/events', params),
+        ('/webhooks/dead-letter-queue', None),
+        ('/webhooks/statistics', None),
+    )
 
     context = {
         'page': 'webhooks',
@@ -269,8 +344,10 @@ def audit_logs():
 @login_required
 def system_health():
     """System health and metrics page."""
-    health  = _api('/health')
-    metrics = _api('/health/metrics')
+    health, metrics = _api_many(
+        ('/health', None),
+        ('/health/metrics', None),
+    )
     context = {
         'page': 'health',
         'health': health,
@@ -1,4 +1,5 @@
 
+import orjson
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.errors.exceptions import BadRequest, AccountNotFound
@@ -16,7 +17,7 @@ def signup():
     Signup route to create a new merchant    :return:  merchant information
     """
     try:
-        data = signup_schema.load(request.json)
+        data = signup_schema.loads(request.get_data())
 
         response = new_merchant(data)
         return jsonify({
@@ -26,6 +27,8 @@ def signup():
 
     except ValidationError as err:
         raise BadRequest(err.messages)
+    except orjson.JSONDecodeError:
+        raise BadRequest("Invalid JSON payload")
 
 @auth_bp.route("/login", methods=["POST"])
 def login():
@@ -34,7 +37,7 @@ def login():
     :return: merchant information
     """
     try:
-        data = login_schema.load(request.json)
+        data = login_schema.loads(request.get_data())
         response = merchant_login(data)
 
         if response is None:
@@ -47,11 +50,13 @@ def login():
 
     except ValidationError as err:
         raise BadRequest(err.messages)
+    except orjson.JSONDecodeError:
+        raise BadRequest("Invalid JSON payload")
 
 @auth_bp.route("/admin/login", methods=["POST"])
 def admin_login():
     try:
-        data = login_schema.load(request.json)
+        data = login_schema.loads(request.get_data())
 
         response = admin_login_service(data)
         if response is None:
@@ -62,5 +67,5 @@ def admin_login():
         }), 200
     except ValidationError as err:
         raise BadRequest(err.messages)
-    except AccountNotFound as err:
-        raise AccountNotFound("Admin not found")
+    except orjson.JSONDecodeError:
+        raise BadRequest("Invalid JSON payload")
@@ -1,19 +1,104 @@
 """
 Health Check and System Monitoring Endpoints
 """
-from typing import Dict
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Tuple
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, current_app
 from datetime import datetime
 import os
 import psutil
-from sqlalchemy import text
+from sqlalchemy import func, text
 
 from app.extensions import db, redis_client
+from app.models import Transaction, WebhookEvent, AuditLog
 
 health_bp = Blueprint('health', __name__)
 
 
+# Prime the CPU counter so the first non-blocking sample has a baseline
+psutil.cpu_percent(interval=None)
+
+# Reused across scrapes instead of re-opening /proc/self on every call
+_PROC = psutil.Process()
+
+# Memory and disk usage are sampled at most this often when scrapes burst
+SYSTEM_SAMPLE_TTL = 2
+_system_sample = (0.0, None, None)
+
+# Scrapers poll metrics every few seconds, so serve the DB counts from Redis briefly
+METRICS_CACHE_KEY = 'metrics:app'
+METRICS_CACHE_TTL = 10
+
+# Single-flight: one thread per process recomputes the counts, concurrent scrapes wait for it
+_metrics_lock = threading.Lock()
+_metrics_local = (0.0, None)
+
+
+def _process() -> psutil.Process:
+    """Return the cached Process for this worker, rebuilding it after a fork"""
+    global _PROC
+
+    if _PROC.pid != os.getpid():
+        _PROC = psutil.Process()
+    return _PROC
+
+
+def _memory_and_disk():
+    """Return (virtual_memory, disk_usage), reusing a sample younger than SYSTEM_SAMPLE_TTL"""
+    global _system_sample
+
+    sampled_at, memory, disk = _system_sample
+    if memory is None or time.monotonic() - sampled_at > SYSTEM_SAMPLE_TTL:
+        memory, disk = psutil.virtual_memory(), psutil.disk_usage('/')
+        _system_sample = (time.monotonic(), memory, disk)
+
+    return memory, disk
+
+
+# Dependency probes are I/O-bound and independent, so run them side by side
+_check_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health-check')
+
+
+def _check_database(app) -> Tuple[str, Dict[str, str]]:
+    """Probe the database on a bare pooled connection, bypassing the ORM session"""
+    with app.app_context():
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(text('SELECT 1'))
+            return 'database', {
+                'status': 'healthy',
+                'message': 'Database connection OK'
+            }
+        except Exception as e:
+            return 'database', {
+                'status': 'unhealthy',
+                'message': f'Database error: {str(e)}'
+            }
+
+
+def _check_redis() -> Tuple[str, Dict[str, str]]:
+    """Probe Redis with a single PING"""
+    try:
+        if redis_client.ping():
+            return 'redis', {
+                'status': 'healthy',
+                'message': 'Redis connection OK'
+            }
+        return 'redis', {
+            'status': 'unhealthy',
+            'message': 'Redis ping failed'
+        }
+    except Exception as e:
+        return 'redis', {
+            'status': 'unhealthy',
+            'message': f'Redis error: {str(e)}'
+        }
+
+
 @health_bp.route('/health', methods=['GET'])
 def health_check():
     """
@@ -31,43 +116,16 @@ def health_check():
     }
 
     checks : Dict[str, Dict[str, str] | str] = {}
-    overall_healthy = True
 
-    # Database check
-    try:
-        db.session.execute(text('SELECT 1'))
-        checks['database'] = {
-            'status': 'healthy',
-            'message': 'Database connection OK'
-        }
-    except Exception as e:
-        checks['database'] = {
-            'status': 'unhealthy',
-            'message': f'Database error: {str(e)}'
-        }
-        overall_healthy = False
+    futures = [
+        _check_executor.submit(_check_database, current_app._get_current_object()),
+        _check_executor.submit(_check_redis),
+    ]
+    for future in as_completed(futures):
+        name, result = future.result()
+        checks[name] = result
 
-    # Redis check
-    try:
-        redis_client.set('health_check', 'ok', ex=10)
-        redis_value = redis_client.get('health_check')
-        if redis_value == 'ok':
-            checks['redis'] = {
-                'status': 'healthy',
-                'message': 'Redis connection OK'
-            }
-        else:
-            checks['redis'] = {
-                'status': 'unhealthy',
-                'message': 'Redis read/write failed'
-            }
-            overall_healthy = False
-    except Exception as e:
-        checks['redis'] = {
-            'status': 'unhealthy',
-            'message': f'Redis error: {str(e)}'
-        }
-        overall_healthy = False
+    overall_healthy = all(check['status'] == 'healthy' for check in checks.values())
 
     health_status['checks'] = checks
     health_status['status'] = 'healthy' if overall_healthy else 'unhealthy'
@@ -76,6 +134,64 @@ def health_check():
 
     return jsonify(health_status), status_code
 
+def _count_application_metrics() -> dict:
+    """Count transactions, webhooks and audit logs"""
+    # One pass over each table instead of a COUNT per status
+    transaction_counts = db.session.query(
+        func.count().label('total'),
+        func.count().filter(Transaction.status == 'pending').label('pending'),
+        func.count().filter(Transaction.status == 'completed').label('completed'),
+        func.count().filter(Transaction.status == 'failed').label('failed')
+    ).select_from(Transaction).one()
+
+    webhook_counts = db.session.query(
+        func.count().label('total'),
+        func.count().filter(WebhookEvent.processed == True).label('processed'),
+        func.count().filter(
+            WebhookEvent.processed == False,
+            WebhookEvent.retry_count >= 5
+        ).label('failed')
+    ).select_from(WebhookEvent).one()
+
+    total_audit_logs = AuditLog.query.count()
+
+    return {
+        'transactions': dict(transaction_counts._mapping),
+        'webhooks': dict(webhook_counts._mapping),
+        'audit_logs': {
+            'total': total_audit_logs
+        }
+    }
+
+
+def _application_metrics() -> dict:
+    """Return application counts from Redis, a fresh local copy, or the database"""
+    global _metrics_local
+
+    try:
+        cached = redis_client.get(METRICS_CACHE_KEY)
+        if cached:
+            return json.loads(cached)
+    except Exception as e:
+        current_app.logger.warning(f'Metrics cache retrieval failed: {str(e)}')
+
+    with _metrics_lock:
+        # Another scrape may have recomputed while this one waited
+        computed_at, application = _metrics_local
+        if application is not None and time.monotonic() - computed_at < METRICS_CACHE_TTL:
+            return application
+
+        application = _count_application_metrics()
+        _metrics_local = (time.monotonic(), application)
+
+    try:
+        redis_client.set(METRICS_CACHE_KEY, json.dumps(application), ex=METRICS_CACHE_TTL)
+    except Exception as e:
+        current_app.logger.warning(f'Metrics cache storage failed: {str(e)}')
+
+    return application
+
+
 @health_bp.route('/metrics', methods=['GET'])
 def metrics():
     """
@@ -85,27 +201,13 @@ def metrics():
         System and application metrics
     """
     try:
-        from app.models import Transaction, WebhookEvent, AuditLog
-
         # System metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        # Non-blocking: utilisation since the previous call
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory, disk = _memory_and_disk()
 
         # Application metrics
-        total_transactions = Transaction.query.count()
-        pending_transactions = Transaction.query.filter_by(status='pending').count()
-        completed_transactions = Transaction.query.filter_by(status='completed').count()
-        failed_transactions = Transaction.query.filter_by(status='failed').count()
-
-        total_webhooks = WebhookEvent.query.count()
-        processed_webhooks = WebhookEvent.query.filter_by(processed=True).count()
-        failed_webhooks = WebhookEvent.query.filter(
-            WebhookEvent.processed == False,
-            WebhookEvent.retry_count >= 5
-        ).count()
-
-        total_audit_logs = AuditLog.query.count()
+        application = _application_metrics()
 
         # Database connection pool metrics
         pool = db.engine.pool
@@ -131,24 +233,11 @@ def metrics():
                 },
                 'process': {
                     'pid': os.getpid(),
-                    'threads': psutil.Process().num_threads()
+                    'threads': _process().num_threads()
                 }
             },
             'application': {
-                'transactions': {
-                    'total': total_transactions,
-                    'pending': pending_transactions,
-                    'completed': completed_transactions,
-                    'failed': failed_transactions
-                },
-                'webhooks': {
-                    'total': total_webhooks,
-                    'processed': processed_webhooks,
-                    'failed': failed_webhooks
-                },
-                'audit_logs': {
-                    'total': total_audit_logs
-                },
+                **application,
                 'database_pool': {
                     'size': pool_size,
                     'checked_out': pool_checked_out,
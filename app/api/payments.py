@@ -1,14 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from marshmallow import ValidationError
+from werkzeug.exceptions import HTTPException
 
 from app.errors import AppError, PaymentNotFound
+from app.errors.exceptions import BadRequest
 from app.schemas.payment_schema import (
     InitializePaymentSchema,
     TransactionSchema
 )
 from app.services.payment_service import PaymentService
 from app.services.idempotency_service import idempotent
-from app.utils.authorization import api_key_required
+from app.utils.authorization import authenticate_api_key
+from app.utils.json_provider import stream_page
 
 payments_bp = Blueprint('payments', __name__)
 
@@ -16,9 +19,38 @@ initialize_schema = InitializePaymentSchema()
 transaction_schema = TransactionSchema()
 
 
+@payments_bp.before_request
+def authenticate():
+    """Every payments endpoint requires a merchant API key"""
+    authenticate_api_key()
+
+
+@payments_bp.errorhandler(ValidationError)
+def handle_validation_error(e):
+    return jsonify({
+        'success': False,
+        'error': 'Validation error',
+        'details': e.messages
+    }), 400
+
+
+@payments_bp.errorhandler(Exception)
+def handle_error(e):
+    if isinstance(e, HTTPException):
+        return e
+
+    if isinstance(e, AppError):
+        body, status_code = e.to_response()
+        return jsonify(body), status_code
+
+    return jsonify({
+        'success': False,
+        'error': str(e)
+    }), 500
+
+
 @payments_bp.route('/initialize', methods=['POST'])
 @idempotent(ttl=86400)
-@api_key_required()
 def initialize_payment():
     """
     Initialize a payment
@@ -39,48 +71,30 @@ def initialize_payment():
             }
         }
     """
-    try:
-        # Validate request data
-        data = initialize_schema.load(request.json)
-
-        # Get idempotency key
-        idempotency_key = request.headers.get('Idempotency-Key')
-
-        #Get api key
-        api_key = request.headers.get('X-API_Key')
-
-        # Initialize payment
-        transaction = PaymentService.initialize_payment(
-            provider=data['provider'],
-            amount=data['amount'],
-            currency=data['currency'],
-            customer_data=data['customer'],
-            metadata=data.get('metadata'),
-            idempotency_key=idempotency_key,
-            api_key=api_key
-        )
+    # Validate request data
+    data = initialize_schema.load(request.json)
 
-        return jsonify({
-            'success': True,
-            'data': transaction_schema.dump(transaction)
-        }), 201
+    # Get idempotency key
+    idempotency_key = request.headers.get('Idempotency-Key')
 
-    except ValidationError as e:
-        return jsonify({
-            'success': False,
-            'error': 'Validation error',
-            'details': e.messages
-        }), 400
+    # Initialize payment
+    transaction = PaymentService.initialize_payment(
+        provider=data['provider'],
+        amount=data['amount'],
+        currency=data['currency'],
+        customer_data=data['customer'],
+        metadata=data.get('metadata'),
+        idempotency_key=idempotency_key,
+        merchant_id=g.merchant_id
+    )
 
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'data': transaction_schema.dump(transaction)
+    }), 201
 
 
 @payments_bp.route('/<uuid:transaction_id>', methods=['GET'])
-@api_key_required()
 def get_payment(transaction_id):
     """
     Get payment details
@@ -88,23 +102,18 @@ def get_payment(transaction_id):
     Path Parameters:
         - transaction_id: Transaction UUID
     """
-    try:
-        transaction = PaymentService.get_transaction(transaction_id)
-
-        if not transaction:
-            raise PaymentNotFound(str(transaction_id))
+    transaction = PaymentService.get_transaction(transaction_id)
 
-        return jsonify({
-            'success': True,
-            'data': transaction_schema.dump(transaction)
-        }), 200
+    if not transaction:
+        raise PaymentNotFound(str(transaction_id))
 
-    except Exception as e:
-        raise AppError(str(e))
+    return jsonify({
+        'success': True,
+        'data': transaction_schema.dump(transaction)
+    }), 200
 
 
 @payments_bp.route('/<uuid:transaction_id>/verify', methods=['POST'])
-@api_key_required()
 def verify_payment(transaction_id):
     """
     Verify payment status with provider
@@ -113,24 +122,18 @@ def verify_payment(transaction_id):
         - transaction_id: Transaction UUID
     """
     try:
-
-        transaction = PaymentService.verify_payment(transaction_id, request.headers.get("Authorization"))
-
-        return jsonify({
-            'success': True,
-            'data': transaction_schema.dump(transaction)
-        }), 200
-
+        transaction = PaymentService.verify_payment(transaction_id, g.merchant_id)
     except ValueError as e:
         raise PaymentNotFound(str(e))
 
-    except Exception as e:
-        raise AppError(str(e))
+    return jsonify({
+        'success': True,
+        'data': transaction_schema.dump(transaction)
+    }), 200
 
 
 
 @payments_bp.route('/payments', methods=['GET'])
-@api_key_required()
 def list_payments():
     """
     List payments with filters
@@ -142,13 +145,13 @@ def list_payments():
         - page: Page number (default: 1)
         - per_page: Items per page (default: 20, max: 100)
     """
-    try:
-        provider = request.args.get('provider')
-        status = request.args.get('status')
-        customer_id = request.args.get('customer_id')
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+    provider = request.args.get('provider')
+    status = request.args.get('status')
+    customer_id = request.args.get('customer_id')
+    page = int(request.args.get('page', 1))
+    per_page = min(int(request.args.get('per_page', 20)), 100)
 
+    try:
         pagination = PaymentService.list_transactions(
             provider=provider,
             status=status,
@@ -156,21 +159,7 @@ def list_payments():
             page=page,
             per_page=per_page
         )
+    except ValueError:
+        raise BadRequest(f'Invalid status: {status}')
 
-        return jsonify({
-            'success': True,
-            'data': {
-                'items': transaction_schema.dump(pagination.items, many=True),
-                'pagination': {
-                    'page': pagination.page,
-                    'per_page': pagination.per_page,
-                    'total': pagination.total,
-                    'pages': pagination.pages,
-                    'has_next': pagination.has_next,
-                    'has_prev': pagination.has_prev
-                }
-            }
-        }), 200
-
-    except Exception as e:
-       raise PaymentNotFound(str(e))
\ No newline at end of file
+    return stream_page(pagination, transaction_schema.dump), 200
@@ -3,15 +3,27 @@ Webhook API Endpoints
 Handles incoming webhooks from payment providers
 """
 
+from datetime import datetime
+
 from flask import Blueprint, request, jsonify
 import json
+import orjson
 
 from app.services.webhook_service import WebhookService
+from app.tasks.process_webhook_task import process_webhook as process_webhook_task
+from app.utils.json_provider import stream_page
 from app.utils.logger import get_logger
 
 webhooks_bp = Blueprint('webhooks', __name__)
 logger = get_logger(__name__)
 
+# Provider -> header carrying its webhook signature (None when it doesn't sign)
+_SIG_HEADERS = {
+    'mpesa': None,
+    'cpay': 'X-CPay-Signature',
+    'StandardBankPay': None,
+}
+
 
 @webhooks_bp.route('/<provider>', methods=['POST'])
 def receive_webhook(provider):
@@ -28,13 +40,19 @@ def receive_webhook(provider):
     Body:
         Provider-specific webhook payload
     """
+    if provider not in _SIG_HEADERS:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown provider: {provider}'
+        }), 404
+
     try:
         # Get raw payload for signature verification
         raw_payload = request.get_data()
 
-        # Parse JSON payload
+        # Parse JSON payload from the same bytes
         try:
-            payload = request.get_json()
+            payload = orjson.loads(raw_payload) if raw_payload else {}
         except Exception as e:
             logger.error(f'Failed to parse webhook payload: {str(e)}')
             return jsonify({
@@ -43,12 +61,8 @@ def receive_webhook(provider):
             }), 400
 
         # Get signature from headers (provider-specific)
-        signature = None
-        if provider == 'mpesa':
-            # M-Pesa doesn't use signatures, but we can verify source IP
-            signature = None
-        elif provider == 'cpay':
-            signature = request.headers.get('X-CPay-Signature')
+        signature_header = _SIG_HEADERS[provider]
+        signature = request.headers.get(signature_header) if signature_header else None
 
         # Log webhook receipt
         logger.info(f'Received webhook from {provider}: {payload.get("event", "unknown")}')
@@ -61,21 +75,14 @@ def receive_webhook(provider):
             raw_payload=raw_payload
         )
 
-        # For now, process synchronously
-        success = WebhookService.process_webhook(webhook_event.id)
+        # Acknowledge straight away, processing happens on a worker
+        process_webhook_task.delay(str(webhook_event.id))
 
-        if success:
-            return jsonify({
-                'success': True,
-                'webhook_event_id': str(webhook_event.id),
-                'message': 'Webhook processed successfully'
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'webhook_event_id': str(webhook_event.id),
-                'message': 'Webhook processing failed, will retry'
-            }), 200  # Still return 200 to prevent provider retries
+        return jsonify({
+            'success': True,
+            'webhook_event_id': str(webhook_event.id),
+            'message': 'Webhook accepted for processing'
+        }), 202
 
     except Exception as e:
         logger.error(f'Webhook error: {str(e)}')
@@ -119,20 +126,7 @@ def list_webhook_events():
             per_page=per_page
         )
 
-        return jsonify({
-            'success': True,
-            'data': {
-                'items': [event.to_dict() for event in pagination.items],
-                'pagination': {
-                    'page': pagination.page,
-                    'per_page': pagination.per_page,
-                    'total': pagination.total,
-                    'pages': pagination.pages,
-                    'has_next': pagination.has_next,
-                    'has_prev': pagination.has_prev
-                }
-            }
-        }), 200
+        return stream_page(pagination, lambda row: row[0], encoded=True), 200
 
     except Exception as e:
         return jsonify({
@@ -209,8 +203,6 @@ def get_webhook_statistics():
         - end_date: End date (ISO format)
     """
     try:
-        from datetime import datetime
-
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
 
@@ -8,6 +8,14 @@ class AppError(Exception):
             self.status_code = status_code
         self.message = message
 
+    def to_response(self):
+        """JSON error envelope and status code for this error"""
+        return {
+            "success": False,
+            "error": self.error,
+            "message": self.message
+        }, self.status_code
+
 
 class ValidationError(AppError):
     status_code = 400
@@ -15,7 +15,18 @@ class RedisClient:
     def init_app(self, app):
         import redis
         from app.config import Config
-        self.client = redis.client.StrictRedis(host=Config.REDIS_HOST, port=Config.REDIS_PORT, db=Config.REDIS_DB)
+
+        # One shared pool per process; callers wait for a free connection instead of opening more
+        pool = redis.BlockingConnectionPool(
+            host=Config.REDIS_HOST,
+            port=Config.REDIS_PORT,
+            db=Config.REDIS_DB,
+            max_connections=Config.REDIS_MAX_CONNECTIONS,
+            decode_responses=True,
+            socket_keepalive=True,
+            health_check_interval=30
+        )
+        self.client = redis.client.StrictRedis(connection_pool=pool)
 
     def get(self, key):
         return self.client.get(key)
@@ -29,6 +40,9 @@ class RedisClient:
     def exists(self, key):
         return self.client.exists(key)
 
+    def ping(self):
+        return self.client.ping()
+
 
 redis_client = RedisClient()
 
@@ -1,4 +1,8 @@
 from celery import Celery
+from celery.signals import worker_process_init
+
+# App context pushed once per forked worker process, see init_celery
+_worker_app_context = None
 
 
 def create_celery(app=None):
@@ -16,11 +20,40 @@ def init_celery(celery, app):
         result_backend=app.config["CELERY_RESULT_BACKEND"],
         task_track_started=True,
         task_time_limit=30 * 60,
+        # Tasks are long and I/O-bound: take one at a time so idle workers aren't starved
+        worker_prefetch_multiplier=1,
+        worker_max_tasks_per_child=1000,
+        broker_connection_retry_on_startup=True,
+        # Long-running, I/O-bound jobs get their own queue and worker pool
+        task_routes={
+            'reconcile_transactions_task': {'queue': 'reconcile'},
+        },
     )
 
+    @worker_process_init.connect(weak=False)
+    def init_worker_app_context(**kwargs):
+        """Push one long-lived app context per forked worker process"""
+        global _worker_app_context
+        from app.extensions import db
+
+        _worker_app_context = app.app_context()
+        _worker_app_context.push()
+
+        # Don't reuse pooled connections inherited from the parent process
+        db.engine.dispose(close=False)
+
     class ContextTask(celery.Task):
         def __call__(self, *args, **kwargs):
-            with app.app_context():
+            if _worker_app_context is None:
+                # Non-prefork pools (eventlet, threads) don't run worker_process_init
+                with app.app_context():
+                    return super().__call__(*args, **kwargs)
+
+            from app.extensions import db
+            try:
                 return super().__call__(*args, **kwargs)
+            finally:
+                # The context outlives the task, so release its session explicitly
+                db.session.remove()
 
-    celery.Task = ContextTask
\ No newline at end of file
+    celery.Task = ContextTask
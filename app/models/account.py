@@ -1,26 +1,41 @@
-import uuid
-from datetime import datetime
+import hashlib
 
-from django.contrib.sitemaps.views import index
 from sqlalchemy.dialects.postgresql.base import UUID
+from sqlalchemy.orm import validates
 
 from app.extensions import db
+from app.utils.ids import uuid7
 
 
 class Account(db.Model):
     __tablename__ = 'account'
+    __table_args__ = (
+        # Covers the API-key -> merchant resolution so it is answered from the index alone
+        db.Index('ix_account_api_key_hash', 'api_key_hash', unique=True, postgresql_include=['merchant_id']),
+    )
 
-    id = db.Column(UUID(as_uuid = True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid = True), primary_key=True, default=uuid7)
     merchant_id = db.Column(UUID(as_uuid = True), db.ForeignKey('merchant.id'))
 
     username = db.Column(db.String(255), index=True, unique=True, nullable=False)
     password = db.Column(db.String(255), nullable=False)
 
     #Encrypted Creds
-    api_key = db.Column(db.String(255), nullable=True, index=True)
+    api_key = db.Column(db.String(255), nullable=True)
+    # Lookups go through the fixed-width SHA-256 digest rather than the raw key
+    api_key_hash = db.Column(db.LargeBinary(32), nullable=True)
 
     #Timestamps
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+    @staticmethod
+    def hash_api_key(api_key: str) -> bytes:
+        return hashlib.sha256(api_key.encode()).digest()
+
+    @validates('api_key')
+    def _sync_api_key_hash(self, key, value):
+        self.api_key_hash = Account.hash_api_key(value) if value else None
+        return value
 
     def to_dict(self) -> dict:
         data = {
@@ -1,13 +1,16 @@
-import uuid
-from datetime import datetime
+from app.utils.ids import uuid7
 from app.extensions import db
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 
 class AuditLog(db.Model):
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Serves ORDER BY timestamp DESC, id DESC and the keyset seek (scanned backwards)
+        db.Index('ix_audit_logs_timestamp_id', 'timestamp', 'id'),
+    )
 
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     transaction_id = db.Column(UUID(as_uuid=True), db.ForeignKey('transactions.id'), nullable=False, index=True)
 
     # Event details
@@ -20,17 +23,20 @@ class AuditLog(db.Model):
     user_agent = db.Column(db.String(500))
 
     # Timestamp
-    timestamp = db.Column(db.DateTime, nullable=False, default=datetime.now, index=True)
+    timestamp = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+    # Relationships
+    transaction = db.relationship('Transaction', back_populates='audit_logs')
 
     def to_dict(self):
         return {
-            'id': str(self.id),
-            'transaction_id': str(self.transaction_id),
+            'id': self.id,
+            'transaction_id': self.transaction_id,
             'event_type': self.event_type,
             'event_data': self.event_data,
             'user_id': self.user_id,
             'ip_address': self.ip_address,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp
         }
 
     def __repr__(self):
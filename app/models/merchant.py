@@ -1,15 +1,13 @@
-import uuid
-from datetime import datetime
-
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.extensions import db
+from app.utils.ids import uuid7
 
 
 class Merchant(db.Model):
     __tablename__ = 'merchant'
 
-    id = db.Column(UUID(as_uuid = True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid = True), primary_key=True, default=uuid7)
 
     #Personal Information
     name = db.Column(db.String(255), nullable=False)
@@ -19,8 +17,8 @@ class Merchant(db.Model):
     business_category = db.Column(db.String(255), nullable=False)
 
     #Timestamps
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self) -> dict:
         data = {
@@ -1,19 +1,16 @@
-import uuid
-from datetime import datetime
-
-from celery.worker.strategy import default
 from sqlalchemy.dialects.postgresql.base import UUID
 
 from app.extensions import db
+from app.utils.ids import uuid7
 
 class ProviderTable(db.Model):
     __tablename__ = 'provider'
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = db.Column(db.String(255), nullable=False)
 
     #Timestamps
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self) -> dict:
         data = {
@@ -1,13 +1,16 @@
-import uuid
-from datetime import datetime
+from app.utils.ids import uuid7
 from app.extensions import db
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 
 class ProviderConfig(db.Model):
     __tablename__ = 'provider_merchant_config'
+    __table_args__ = (
+        db.Index('ix_provider_config_merchant_provider', 'merchant_id', 'provider_id', unique=True),
+    )
 
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    merchant_id = db.Column(UUID(as_uuid=True), db.ForeignKey('merchant.id'), nullable=False)
     provider_id = db.Column(UUID(as_uuid=True), db.ForeignKey('provider.id'), nullable=False)
     is_active = db.Column(db.Boolean, default=False)
 
@@ -15,17 +18,18 @@ class ProviderConfig(db.Model):
     config = db.Column(JSONB)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self, include_secrets=False):
         data = {
-            'id': str(self.id),
+            'id': self.id,
+            'merchant_id': self.merchant_id,
             'provider_id': self.provider_id,
             'is_active': self.is_active,
             'config': self.config,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
         return data
 
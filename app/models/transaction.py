@@ -1,5 +1,4 @@
-import uuid
-from datetime import datetime
+from app.utils.ids import uuid7
 from app.extensions import db
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from enum import Enum
@@ -15,8 +14,13 @@ class TransactionStatus(str, Enum):
 
 class Transaction(db.Model):
     __tablename__ = 'transactions'
+    __table_args__ = (
+        db.Index('ix_transactions_status_created_at', 'status', 'created_at'),
+    )
 
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    # Owning merchant, whose provider configuration is used for follow-up calls
+    merchant_id = db.Column(UUID(as_uuid=True), db.ForeignKey('merchant.id'))
     idempotency_key = db.Column(db.String(255), unique=True, nullable=False, index=True)
 
     # Provider information
@@ -27,7 +31,12 @@ class Transaction(db.Model):
     # Payment details
     amount = db.Column(db.Numeric(15, 2), nullable=False)
     currency = db.Column(db.String(3), nullable=False, default='KES')
-    status = db.Column(db.String(20), nullable=False, default=TransactionStatus.PENDING)
+    status = db.Column(
+        db.Enum(TransactionStatus, name='transaction_status',
+                values_callable=lambda statuses: [status.value for status in statuses]),
+        nullable=False,
+        default=TransactionStatus.PENDING
+    )
 
     # Customer information
     customer_id = db.Column(db.String(255), index=True)
@@ -38,19 +47,24 @@ class Transaction(db.Model):
     # Payment method
     payment_method = db.Column(db.String(50))  # mpesa, card, etc.
 
+    # Merchant-supplied metadata; `metadata` is reserved on declarative models
+    extra = db.Column('metadata', JSONB)
+
     # Timestamps
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now(), onupdate=db.func.now())
     completed_at = db.Column(db.DateTime)
 
     # Relationships
-    audit_logs = db.relationship('AuditLog', backref='transaction', lazy='dynamic', cascade='all, delete-orphan')
-    webhook_events = db.relationship('WebhookEvent', backref='transaction', lazy='dynamic',
+    # Plain collections: eager-load with selectinload() where a listing needs them
+    audit_logs = db.relationship('AuditLog', back_populates='transaction', lazy='select',
+                                 cascade='all, delete-orphan')
+    webhook_events = db.relationship('WebhookEvent', back_populates='transaction', lazy='select',
                                      cascade='all, delete-orphan')
 
     def to_dict(self):
         return {
-            'id': str(self.id),
+            'id': self.id,
             'idempotency_key': self.idempotency_key,
             'provider': self.provider,
             'provider_transaction_id': self.provider_transaction_id,
@@ -64,9 +78,10 @@ class Transaction(db.Model):
                 'name': self.customer_name
             },
             'payment_method': self.payment_method,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+            'metadata': self.extra,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'completed_at': self.completed_at
         }
 
     def __repr__(self):
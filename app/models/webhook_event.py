@@ -1,13 +1,20 @@
-import uuid
-from datetime import datetime
+from app.utils.ids import uuid7
 from app.extensions import db
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 
 class WebhookEvent(db.Model):
     __tablename__ = 'webhook_events'
-
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Unprocessed events are a small slice of the table; serves retry sweeps and the dead-letter queue
+        db.Index(
+            'ix_webhook_events_unprocessed_retry_count',
+            'retry_count',
+            postgresql_where=db.text('processed = false')
+        ),
+    )
+
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     transaction_id = db.Column(UUID(as_uuid=True), db.ForeignKey('transactions.id'), index=True)
 
     # Provider information
@@ -20,25 +27,28 @@ class WebhookEvent(db.Model):
     verified = db.Column(db.Boolean, default=False)
 
     # Processing status
-    processed = db.Column(db.Boolean, default=False, index=True)
+    processed = db.Column(db.Boolean, default=False)
     retry_count = db.Column(db.Integer, default=0)
     error_message = db.Column(db.Text)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
     processed_at = db.Column(db.DateTime)
 
+    # Relationships
+    transaction = db.relationship('Transaction', back_populates='webhook_events')
+
     def to_dict(self):
         return {
-            'id': str(self.id),
-            'transaction_id': str(self.transaction_id) if self.transaction_id else None,
+            'id': self.id,
+            'transaction_id': self.transaction_id,
             'provider': self.provider,
             'event_type': self.event_type,
             'verified': self.verified,
             'processed': self.processed,
             'retry_count': self.retry_count,
-            'created_at': self.created_at.isoformat(),
-            'processed_at': self.processed_at.isoformat() if self.processed_at else None
+            'created_at': self.created_at,
+            'processed_at': self.processed_at
         }
 
     def __repr__(self):
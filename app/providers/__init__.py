@@ -1,6 +1,12 @@
+import threading
+import uuid
 from typing import Dict, Type
 
-from app.models import Account, ProviderConfig, ProviderTable
+from cachetools import TTLCache
+from sqlalchemy import event, select
+
+from app.extensions import db
+from app.models import ProviderConfig, ProviderTable
 from app.providers.base import PaymentProvider
 from app.providers.standard_bank_pay_provider import StandardBankPayProvider
 
@@ -9,45 +15,105 @@ PROVIDERS: Dict[str, Type[PaymentProvider]] = {
     "StandardBankPay" : StandardBankPayProvider
 }
 
+# Merchant provider configs, keyed by (provider name, merchant id).
+# ORM writes evict entries in the writing process; other processes (and
+# changes made outside the app) pick up new configs within CONFIG_CACHE_TTL.
+CONFIG_CACHE_MAX_ENTRIES = 1024
+CONFIG_CACHE_TTL = 15
+
+_config_cache = TTLCache(maxsize=CONFIG_CACHE_MAX_ENTRIES, ttl=CONFIG_CACHE_TTL)
+_config_cache_lock = threading.RLock()
+
+
+def invalidate_provider_config(merchant_id: uuid.UUID) -> None:
+    """Drop this process's cached provider configs for a merchant"""
+    with _config_cache_lock:
+        for key in [key for key in _config_cache if key[1] == merchant_id]:
+            _config_cache.pop(key, None)
 
-def get_provider(provider_name: str, api_key : str) -> PaymentProvider:
+
+@event.listens_for(ProviderConfig, 'after_update')
+@event.listens_for(ProviderConfig, 'after_delete')
+def _evict_provider_config(_mapper, _connection, target):
+    invalidate_provider_config(target.merchant_id)
+
+
+def get_provider(provider_name: str, merchant_id: uuid.UUID | None) -> PaymentProvider:
     """
-    Get provider instance by name.
+    Get provider instance by name, configured for a merchant.
 
     Args:
-        provider_name: Name of the provider ('cpay', etc.)
-        api_key: Api key to use for authentication
+        provider_name: Name of the provider ('StandardBankPay', etc.)
+        merchant_id: Merchant whose provider configuration to use
 
     Returns:
         Initialized provider instance
 
     Raises:
-        ValueError: If provider not found
+        ValueError: If provider not found or not configured for the merchant
     """
-    provider_class = PROVIDERS.get(provider_name.lower())
+    provider_class = PROVIDERS.get(provider_name)
 
     if not provider_class:
         raise ValueError(f'Unknown provider: {provider_name}')
 
-    config = _get_merchant_provider_config(provider_name.lower(), api_key)
+    config = _get_merchant_provider_config(provider_name, merchant_id) if merchant_id else None
+
+    if config is None:
+        raise ValueError(f'Provider {provider_name} is not configured for merchant {merchant_id}')
+
     return provider_class(config)
 
 
-def _get_merchant_provider_config(provider_name: str, merchant_api_key: str) -> dict | None:
-    merchant_id = Account.query.filter_by(_api_key = merchant_api_key).first().to_dict()['merchant_id']
-    provider_id = ProviderTable.query.filter_by(name = provider_name).first().to_dict()['id']
-    if not merchant_id and not provider_id:
+def webhook_transaction_id(provider_name: str, payload: dict) -> str | None:
+    """
+    Get the provider's transaction ID from a webhook payload
+
+    Raises:
+        ValueError: If provider not found
+    """
+    provider_class = PROVIDERS.get(provider_name)
+
+    if not provider_class:
+        raise ValueError(f'Unknown provider: {provider_name}')
+
+    return provider_class.webhook_transaction_id(payload)
+
+
+def _get_merchant_provider_config(provider_name: str, merchant_id: uuid.UUID) -> dict | None:
+    """
+    Resolve a merchant's configuration for a provider in a single query
+
+    Found configurations are cached for CONFIG_CACHE_TTL seconds, or until
+    invalidate_provider_config is called for the merchant.
+    """
+    key = (provider_name, merchant_id)
+
+    with _config_cache_lock:
+        config = _config_cache.get(key)
+    if config is not None:
+        return config
+
+    config = db.session.execute(
+        select(ProviderConfig.config).join(
+            ProviderTable, ProviderTable.id == ProviderConfig.provider_id
+        ).where(
+            ProviderTable.name == provider_name,
+            ProviderConfig.merchant_id == merchant_id
+        )
+    ).scalar_one_or_none()
+
+    if not config:
         return None
-    else:
-        config = ProviderConfig.query.filter_by(merchant_id = merchant_id, provider_id = provider_id).get("config")
-        if not config:
-            return None
-        else:
-            return config
+
+    with _config_cache_lock:
+        _config_cache[key] = config
+
+    return config
 
 def list_available_providers():
     """List all available providers."""
     return list(PROVIDERS)
 
 
-__all__ = ['get_provider', 'list_available_providers', 'PROVIDERS']
\ No newline at end of file
+__all__ = ['get_provider', 'webhook_transaction_id', 'invalidate_provider_config', 'list_available_providers', 'PROVIDERS']
\ No newline at end of file
@@ -72,6 +72,23 @@ class PaymentProvider(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def webhook_transaction_id(payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract the provider's transaction ID from a webhook payload
+
+        Needs no merchant configuration, so it is used to find the
+        transaction (and so the merchant) a webhook belongs to.
+
+        Args:
+            payload: Webhook payload
+
+        Returns:
+            Provider's transaction ID, or None if the payload has none
+        """
+        pass
+
     @abstractmethod
     def handle_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
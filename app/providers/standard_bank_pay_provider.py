@@ -1,5 +1,9 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
 from typing import Dict, Any, Optional
+from urllib3.util import Retry
 
 from app.providers.base import (
     PaymentProvider,
@@ -9,11 +13,58 @@ from app.providers.base import (
 )
 
 
+# Keep-alive pool shared by every provider instance in the process
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the HTTP session used for gateway calls
+
+    Connections are reused across requests instead of paying a TCP/TLS
+    handshake per call. Only GETs are retried: initiating a payment is not
+    safe to replay blindly.
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _build_session()
+
+
 class StandardBankPayProvider(PaymentProvider):
     """
     Adapter for Standard Bank Pay
     """
 
+    # Provider processing_state -> internal status
+    STATUS_MAP = MappingProxyType({
+        "AWAITING_CUSTOMER": "pending",
+        "SETTLED": "completed",
+    })
+
+    # Webhook event_type -> internal status
+    WEBHOOK_STATUS_MAP = MappingProxyType({
+        "PAYMENT_SETTLED": "completed",
+    })
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
 
@@ -22,23 +73,23 @@ class StandardBankPayProvider(PaymentProvider):
         self.client_id = config["client_id"]
         self.timeout = config.get("timeout", 30)
 
-    # Internal helpers
-
-    def _headers(self, request_id: str) -> Dict[str, str]:
-        return {
+        # Built once per provider instead of on every request
+        self._initiate_url = f"{self.base_url}/api/v1/payments/initiate"
+        self._payments_url = f"{self.base_url}/api/v1/payments/"
+        self._static_headers = {
             "Authorization": f"Bearer {self.api_key}",
             "X-SBP-Client-Id": self.client_id,
-            "X-SBP-Request-Id": request_id,
             "Content-Type": "application/json",
         }
 
+    # Internal helpers
+
+    def _headers(self, request_id: str) -> Dict[str, str]:
+        return {**self._static_headers, "X-SBP-Request-Id": request_id}
+
     def _map_status(self, sbp_status: str) -> str:
         """Normalize provider status to internal status"""
-        mapping = {
-            "AWAITING_CUSTOMER": "pending",
-            "SETTLED": "completed",
-        }
-        return mapping.get(sbp_status, "processing")
+        return self.STATUS_MAP.get(sbp_status, "processing")
 
     # Required interface
 
@@ -62,9 +113,9 @@ class StandardBankPayProvider(PaymentProvider):
         }
 
         try:
-            resp = requests.post(
-                f"{self.base_url}/api/v1/payments/initiate",
-                json=payload,
+            resp = _session.post(
+                self._initiate_url,
+                data=orjson.dumps(payload),
                 headers=self._headers(request_id),
                 timeout=self.timeout,
             )
@@ -74,7 +125,7 @@ class StandardBankPayProvider(PaymentProvider):
         if resp.status_code >= 400:
             raise PaymentInitializationError(resp.text)
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         return {
             "transaction_id": data["sbp_txn_ref"],
@@ -93,8 +144,8 @@ class StandardBankPayProvider(PaymentProvider):
         request_id = f"verify-{provider_transaction_id}"
 
         try:
-            resp = requests.get(
-                f"{self.base_url}/api/v1/payments/{provider_transaction_id}/status",
+            resp = _session.get(
+                self._payments_url + provider_transaction_id + "/status",
                 headers=self._headers(request_id),
                 timeout=self.timeout,
             )
@@ -104,7 +155,7 @@ class StandardBankPayProvider(PaymentProvider):
         if resp.status_code >= 400:
             raise PaymentVerificationError(resp.text)
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         return {
             "status": self._map_status(data["processing_state"]),
@@ -126,28 +177,28 @@ class StandardBankPayProvider(PaymentProvider):
         return True
 
 
+    @staticmethod
+    def webhook_transaction_id(payload: Dict[str, Any]) -> Optional[str]:
+        return payload.get("sbp_txn_ref")
+
     def handle_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
 
         event_type = payload.get("event_type")
-        txn_ref = payload.get("sbp_txn_ref")
+        txn_ref = self.webhook_transaction_id(payload)
 
         if not txn_ref:
             raise WebhookVerificationError("Missing transaction reference")
 
-        # Map webhook events
-        status_map = {
-            "PAYMENT_SETTLED": "completed",
-        }
-
-        normalized_status = status_map.get(event_type, "processing")
+        normalized_status = self.WEBHOOK_STATUS_MAP.get(event_type, "processing")
+        details = payload.get("details") or {}
 
         return {
             "transaction_id": txn_ref,
             "event_type": event_type,
             "status": normalized_status,
             "additional_data": {
-                "ledger_entry_id": payload.get("details", {}).get("ledger_entry_id"),
-                "net_amount": payload.get("details", {}).get("net_amount"),
+                "ledger_entry_id": details.get("ledger_entry_id"),
+                "net_amount": details.get("net_amount"),
                 "raw": payload,
             },
         }
\ No newline at end of file
@@ -1,3 +1,4 @@
+import orjson
 from marshmallow import Schema, fields
 
 
@@ -13,6 +14,9 @@ class AuthSchema(Schema):
 
 class SignupSchema(Schema):
     """ Request for signup """
+    class Meta:
+        render_module = orjson
+
     name = fields.Str(required=True)
     email = fields.Email(required=True)
     number = fields.Str(required=True)
@@ -23,5 +27,8 @@ class SignupSchema(Schema):
 
 class LoginSchema(Schema):
     """request for login"""
+    class Meta:
+        render_module = orjson
+
     username = fields.Str(required=True)
     password = fields.Str(required=True)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from marshmallow import Schema, fields, validates, ValidationError
 
+from app.models import TransactionStatus
 from app.providers import list_available_providers
 
 
@@ -19,14 +20,14 @@ class InitializePaymentSchema(Schema):
     customer = fields.Nested(CustomerSchema, required=True)
 
     @validates('amount')
-    def validate_amount(self, value):
+    def validate_amount(self, value, **kwargs):
         if value <= 0:
             raise ValidationError('Amount must be greater than 0')
 
     @validates('provider')
-    def validate_provider(self, value):
+    def validate_provider(self, value, **kwargs):
         allowed_providers = list_available_providers()
-        if value.lower() not in allowed_providers:
+        if value not in allowed_providers:
             raise ValidationError(f'Provider must be one of: {", ".join(allowed_providers)}')
 
 
@@ -39,7 +40,7 @@ class TransactionSchema(Schema):
     provider_transaction_id = fields.Str(dump_only=True)
     amount = fields.Decimal(places=2, dump_only=True)
     currency = fields.Str(dump_only=True)
-    status = fields.Str(dump_only=True)
+    status = fields.Enum(TransactionStatus, by_value=True, dump_only=True)
     customer = fields.Dict(dump_only=True)
     payment_method = fields.Str(dump_only=True)
     provider_response = fields.Dict(dump_only=True)
@@ -25,7 +25,7 @@ class MPesaCallbackSchema(Schema):
     Body = fields.Dict(required=True)
 
     @validates('Body')
-    def validate_body(self, value):
+    def validate_body(self, value, **kwargs):
         if 'stkCallback' not in value:
             raise ValidationError('Missing stkCallback in Body')
 
@@ -3,10 +3,13 @@ Audit Service
 Handles comprehensive audit logging for all payment transactions
 """
 
+import base64
+import logging
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from flask import request
+from sqlalchemy import String, Row, cast, func, tuple_
 
 from app.extensions import db
 from app.models import AuditLog
@@ -15,6 +18,17 @@ from app.models import AuditLog
 class AuditService:
     """Service for creating and managing audit logs"""
 
+    # Columns returned by the audit log listings (the public fields of AuditLog.to_dict)
+    LIST_COLUMNS = (
+        AuditLog.id,
+        AuditLog.transaction_id,
+        AuditLog.event_type,
+        AuditLog.event_data,
+        AuditLog.user_id,
+        AuditLog.ip_address,
+        AuditLog.timestamp,
+    )
+
     @staticmethod
     def log_event(
             transaction_id: uuid.UUID,
@@ -22,7 +36,8 @@ class AuditService:
             event_data: Dict[str, Any],
             user_id: Optional[str] = None,
             ip_address: Optional[str] = None,
-            user_agent: Optional[str] = None
+            user_agent: Optional[str] = None,
+            commit: bool = True
     ) -> AuditLog:
         """
         Create an audit log entry
@@ -34,6 +49,7 @@ class AuditService:
             user_id: User ID if available
             ip_address: IP address of the request
             user_agent: User agent string
+            commit: Commit immediately; pass False to write the entry with the caller's own commit
 
         Returns:
             Created AuditLog object
@@ -56,12 +72,14 @@ class AuditService:
 
         db.session.add(audit_log)
 
+        if not commit:
+            return audit_log
+
         try:
             db.session.commit()
         except Exception as e:
             db.session.rollback()
             # Log to application logger
-            import logging
             logging.error(f'Failed to create audit log: {str(e)}')
             raise
 
@@ -82,6 +100,34 @@ class AuditService:
             transaction_id=transaction_id
         ).order_by(AuditLog.timestamp.asc()).all()
 
+    @staticmethod
+    def _filter_audit_logs(
+            transaction_id: Optional[uuid.UUID] = None,
+            event_type: Optional[str] = None,
+            user_id: Optional[str] = None,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ):
+        """Build the filtered audit log query shared by both pagination styles"""
+        query = AuditLog.query
+
+        if transaction_id:
+            query = query.filter_by(transaction_id=transaction_id)
+
+        if event_type:
+            query = query.filter_by(event_type=event_type)
+
+        if user_id:
+            query = query.filter_by(user_id=user_id)
+
+        if start_date:
+            query = query.filter(AuditLog.timestamp >= start_date)
+
+        if end_date:
+            query = query.filter(AuditLog.timestamp <= end_date)
+
+        return query
+
     @staticmethod
     def get_audit_logs(
             transaction_id: Optional[uuid.UUID] = None,
@@ -105,30 +151,97 @@ class AuditService:
             per_page: Items per page
 
         Returns:
-            Paginated audit logs
+            Paginated audit log rows (LIST_COLUMNS only, not ORM objects)
         """
-        query = AuditLog.query
+        query = AuditService._filter_audit_logs(
+            transaction_id=transaction_id,
+            event_type=event_type,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date
+        ).with_entities(*AuditService.LIST_COLUMNS)
 
-        if transaction_id:
-            query = query.filter_by(transaction_id=transaction_id)
+        return query.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).paginate(
+            page=page,
+            per_page=per_page,
+            error_out=False
+        )
 
-        if event_type:
-            query = query.filter_by(event_type=event_type)
+    @staticmethod
+    def get_audit_logs_after(
+            cursor: Optional[str] = None,
+            transaction_id: Optional[uuid.UUID] = None,
+            event_type: Optional[str] = None,
+            user_id: Optional[str] = None,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            per_page: int = 50
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Get audit logs with filters using keyset pagination
 
-        if user_id:
-            query = query.filter_by(user_id=user_id)
+        Seeks past the cursor on (timestamp, id) instead of using OFFSET, so
+        deep pages cost the same as the first one.
 
-        if start_date:
-            query = query.filter(AuditLog.timestamp >= start_date)
+        Args:
+            cursor: Opaque cursor from a previous page (None for the first page)
+            transaction_id: Filter by transaction ID
+            event_type: Filter by event type
+            user_id: Filter by user ID
+            start_date: Filter by start date
+            end_date: Filter by end date
+            per_page: Items per page
 
-        if end_date:
-            query = query.filter(AuditLog.timestamp <= end_date)
+        Returns:
+            Tuple of (audit log rows, cursor for the next page or None)
 
-        return query.order_by(AuditLog.timestamp.desc()).paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = AuditService._filter_audit_logs(
+            transaction_id=transaction_id,
+            event_type=event_type,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date
+        ).with_entities(*AuditService.LIST_COLUMNS)
+
+        if cursor:
+            cursor_timestamp, cursor_id = AuditService.decode_cursor(cursor)
+            query = query.filter(
+                tuple_(AuditLog.timestamp, AuditLog.id) < tuple_(cursor_timestamp, cursor_id)
+            )
+
+        # Fetch one extra row to learn whether another page exists
+        logs = query.order_by(
+            AuditLog.timestamp.desc(), AuditLog.id.desc()
+        ).limit(per_page + 1).all()
+
+        if len(logs) > per_page:
+            logs = logs[:per_page]
+            return logs, AuditService.encode_cursor(logs[-1])
+
+        return logs, None
+
+    @staticmethod
+    def encode_cursor(audit_log) -> str:
+        """Encode an audit log's (timestamp, id) position as an opaque cursor"""
+        raw = f'{audit_log.timestamp.isoformat()}|{audit_log.id}'
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """
+        Decode a cursor produced by encode_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            timestamp, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(timestamp), uuid.UUID(log_id)
+        except Exception:
+            raise ValueError('Invalid cursor')
 
     @staticmethod
     def _get_client_ip() -> Optional[str]:
@@ -185,7 +298,6 @@ class AuditService:
             return len(audit_logs)
         except Exception as e:
             db.session.rollback()
-            import logging
             logging.error(f'Failed to create bulk audit logs: {str(e)}')
             raise
 
@@ -204,8 +316,6 @@ class AuditService:
         Returns:
             Dict with event types as keys and counts as values
         """
-        from sqlalchemy import func
-
         query = db.session.query(
             AuditLog.event_type,
             func.count(AuditLog.id).label('count')
@@ -239,8 +349,6 @@ class AuditService:
             Paginated search results
         """
         # PostgreSQL JSONB search
-        from sqlalchemy import cast, String
-
         query = AuditLog.query.filter(
             cast(AuditLog.event_data, String).contains(search_term)
         )
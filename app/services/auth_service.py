@@ -48,20 +48,25 @@ def new_merchant(data : dict) -> dict:
 
 def merchant_login(data : dict) -> dict[str, dict | Any] | None:
     try:
-        account = Account.query.filter_by(username= data["username"], password= hash_string(data["password"])).first()
-        if account:
-            merchant = Merchant.query.filter_by(id= account.merchant_id).first()
-            if merchant:
-                response = {
-                    "id": merchant.id,
-                    "name": merchant.name,
-                    "email": merchant.email,
-                    "number": merchant.number,
-                    "business_name": merchant.business_name,
-                    "business_category": merchant.business_category,
-                    "api_key": encrypt_response(account.api_key, merchant.id)
-                }
-                return response
+        # One round trip for both rows; username has a unique index
+        row = db.session.query(Account, Merchant).join(
+            Merchant, Merchant.id == Account.merchant_id
+        ).filter(
+            Account.username == data["username"],
+            Account.password == hash_string(data["password"])
+        ).first()
+        if row:
+            account, merchant = row
+            response = {
+                "id": merchant.id,
+                "name": merchant.name,
+                "email": merchant.email,
+                "number": merchant.number,
+                "business_name": merchant.business_name,
+                "business_category": merchant.business_category,
+                "api_key": encrypt_response(account.api_key, merchant.id)
+            }
+            return response
     except Exception as e:
         raise AppError(str(e))
 
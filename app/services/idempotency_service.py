@@ -1,8 +1,22 @@
 import json
+import threading
+import time
 from functools import wraps
+
+from cachetools import TLRUCache
 from flask import request, jsonify
 from app.extensions import redis_client
 
+# Per-process L1 in front of Redis so retry bursts on one key skip the round trip.
+# Entries are (expires_at, response) and never outlive the Redis TTL they mirror.
+# Deletes only reach this process's L1, so other workers may keep serving a
+# deleted response for up to L1_TTL seconds; keep it short.
+L1_MAX_ENTRIES = 10_000
+L1_TTL = 1
+
+_L1 = TLRUCache(maxsize=L1_MAX_ENTRIES, ttu=lambda _key, value, now: min(value[0], now + L1_TTL), timer=time.time)
+_L1_lock = threading.RLock()
+
 
 class IdempotencyService:
     """Handle request idempotency using Redis"""
@@ -18,10 +32,19 @@ class IdempotencyService:
     def get_cached_response(idempotency_key: str):
         """Get cached response for idempotency key"""
         key = IdempotencyService.get_key(idempotency_key)
+
+        with _L1_lock:
+            entry = _L1.get(key)
+        if entry is not None:
+            return entry[1]
+
         cached = redis_client.get(key)
 
         if cached:
-            return json.loads(cached)
+            response_data = json.loads(cached)
+            with _L1_lock:
+                _L1[key] = (time.time() + L1_TTL, response_data)
+            return response_data
         return None
 
     @staticmethod
@@ -30,10 +53,22 @@ class IdempotencyService:
         key = IdempotencyService.get_key(idempotency_key)
         redis_client.set(key, json.dumps(response_data), ex=ttl)
 
+        with _L1_lock:
+            _L1[key] = (time.time() + ttl, response_data)
+
     @staticmethod
     def delete_cached_response(idempotency_key: str):
-        """Delete cached response"""
+        """
+        Delete cached response
+
+        Removes the Redis entry and this process's L1 entry. Other processes
+        drop their L1 copy within L1_TTL seconds.
+        """
         key = IdempotencyService.get_key(idempotency_key)
+
+        with _L1_lock:
+            _L1.pop(key, None)
+
         redis_client.delete(key)
 
 
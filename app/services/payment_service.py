@@ -1,6 +1,7 @@
 import uuid
 from typing import Dict, Any, Optional
-from datetime import datetime
+
+from sqlalchemy.orm import raiseload
 
 from app.extensions import db
 from app.models import Transaction, TransactionStatus
@@ -19,7 +20,7 @@ class PaymentService:
             customer_data: Dict[str, Any],
             metadata: Optional[Dict[str, Any]] = None,
             idempotency_key: Optional[str] = None,
-            api_key: str = None
+            merchant_id: Optional[uuid.UUID] = None
     ) -> Transaction:
         """
         Initialize a new payment transaction
@@ -31,7 +32,7 @@ class PaymentService:
             customer_data: Customer information
             metadata: Additional metadata
             idempotency_key: Idempotency key for request
-            api_key: merchant API key
+            merchant_id: Merchant initiating the payment
 
         Returns:
             Transaction object
@@ -46,6 +47,7 @@ class PaymentService:
         # Create transaction record
         transaction = Transaction(
             idempotency_key=idempotency_key or str(uuid.uuid4()),
+            merchant_id=merchant_id,
             provider=provider,
             amount=amount,
             currency=currency,
@@ -54,7 +56,7 @@ class PaymentService:
             customer_email=customer_data.get('email'),
             customer_name=customer_data.get('name'),
             payment_method=provider,
-            metadata=metadata,
+            extra=metadata,
             status=TransactionStatus.PENDING
         )
 
@@ -78,7 +80,7 @@ class PaymentService:
 
         try:
             # Initialize payment with provider
-            provider_instance = get_provider(provider, api_key)
+            provider_instance = get_provider(provider, merchant_id)
             result = provider_instance.initialize_payment(
                 amount=amount,
                 currency=currency,
@@ -126,20 +128,22 @@ class PaymentService:
         return transaction
 
     @staticmethod
-    def verify_payment(transaction_id: uuid.UUID, api_key : str) -> Transaction:
+    def verify_payment(transaction_id: uuid.UUID, merchant_id: Optional[uuid.UUID] = None) -> Transaction:
         """
         Verify payment status with provider
 
+        The provider is called with the owning merchant's configuration.
+
         Args:
             transaction_id: Transaction UUID
-            api_key:
+            merchant_id: Only verify this merchant's transactions (None for internal callers)
 
         Returns:
             Updated transaction
         """
         transaction = Transaction.query.get(transaction_id)
 
-        if not transaction:
+        if not transaction or (merchant_id and transaction.merchant_id != merchant_id):
             raise ValueError(f'Transaction {transaction_id} not found')
 
         # Don't verify completed or refunded transactions
@@ -147,7 +151,7 @@ class PaymentService:
             return transaction
 
         try:
-            provider_instance = get_provider(transaction.provider)
+            provider_instance = get_provider(transaction.provider, transaction.merchant_id)
             result = provider_instance.verify_payment(transaction.provider_transaction_id)
 
             # Update transaction status
@@ -156,7 +160,7 @@ class PaymentService:
 
             if new_status == 'completed':
                 transaction.status = TransactionStatus.COMPLETED
-                transaction.completed_at = datetime.now()
+                transaction.completed_at = db.func.now()
             elif new_status == 'failed':
                 transaction.status = TransactionStatus.FAILED
 
@@ -167,7 +171,7 @@ class PaymentService:
             if old_status != transaction.status:
                 AuditService.log_event(
                     transaction_id=transaction.id,
-                    event_type=f'payment.{transaction.status}',
+                    event_type=f'payment.{transaction.status.value}',
                     event_data={
                         'old_status': old_status,
                         'new_status': transaction.status,
@@ -176,7 +180,7 @@ class PaymentService:
                 )
 
                 # # Emit WebSocket event
-                # emit_transaction_update(transaction, f'payment.{transaction.status}')
+                # emit_transaction_update(transaction, f'payment.{transaction.status.value}')
 
         except Exception as e:
             AuditService.log_event(
@@ -207,14 +211,18 @@ class PaymentService:
 
         Returns:
             Paginated list of transactions
+
+        Raises:
+            ValueError: If status is not a TransactionStatus value
         """
-        query = Transaction.query
+        # Listings never touch relationships; fail loudly instead of issuing N lazy loads
+        query = Transaction.query.options(raiseload('*'))
 
         if provider:
             query = query.filter_by(provider=provider)
 
         if status:
-            query = query.filter_by(status=status)
+            query = query.filter_by(status=TransactionStatus(status))
 
         if customer_id:
             query = query.filter_by(customer_id=customer_id)
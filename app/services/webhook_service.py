@@ -3,15 +3,21 @@ Webhook Service
 Handles receiving, verifying, and processing webhooks from payment providers
 """
 
+import logging
 import uuid
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import time
 
+from sqlalchemy import Text, cast, func
+from sqlalchemy.exc import OperationalError
+
 from app.extensions import db
 from app.models import WebhookEvent, Transaction, TransactionStatus
-from app.providers import get_provider
+from app.providers import get_provider, webhook_transaction_id
 from app.services.audit_service import AuditService
+from app.utils.clock import db_now
 
 
 class WebhookService:
@@ -23,6 +29,47 @@ class WebhookService:
     # Retry schedule in seconds: 1min, 5min, 15min, 1hr, 6hr
     RETRY_SCHEDULE = [60, 300, 900, 3600, 21600]
 
+    # Normalized webhook status -> transaction status; other statuses leave the transaction as is
+    STATUS_TRANSITIONS = MappingProxyType({
+        'completed': TransactionStatus.COMPLETED,
+        'failed': TransactionStatus.FAILED,
+        'refunded': TransactionStatus.REFUNDED,
+    })
+
+    # Webhook event listing rendered straight to JSON text by Postgres (the fields of WebhookEvent.to_dict)
+    LIST_JSON = cast(func.json_build_object(
+        'id', WebhookEvent.id,
+        'transaction_id', WebhookEvent.transaction_id,
+        'provider', WebhookEvent.provider,
+        'event_type', WebhookEvent.event_type,
+        'verified', WebhookEvent.verified,
+        'processed', WebhookEvent.processed,
+        'retry_count', WebhookEvent.retry_count,
+        'created_at', WebhookEvent.created_at,
+        'processed_at', WebhookEvent.processed_at
+    ), Text)
+
+    @staticmethod
+    def _find_transaction(provider: str, payload: Dict[str, Any]) -> tuple[Optional[str], Optional[Transaction]]:
+        """
+        Find the transaction a webhook refers to
+
+        Provider calls are made with the configuration of the merchant that owns it.
+
+        Returns:
+            (provider transaction ID, Transaction or None)
+        """
+        provider_transaction_id = webhook_transaction_id(provider, payload)
+
+        if not provider_transaction_id:
+            return None, None
+
+        transaction = Transaction.query.filter_by(
+            provider_transaction_id=provider_transaction_id
+        ).first()
+
+        return provider_transaction_id, transaction
+
     @staticmethod
     def receive_webhook(
             provider: str,
@@ -58,7 +105,11 @@ class WebhookService:
         # Verify signature if provided
         if signature and raw_payload:
             try:
-                provider_instance = get_provider(provider)
+                provider_transaction_id, transaction = WebhookService._find_transaction(provider, payload)
+                if not transaction:
+                    raise ValueError(f'Transaction not found: {provider_transaction_id}')
+
+                provider_instance = get_provider(provider, transaction.merchant_id)
                 is_valid = provider_instance.verify_webhook_signature(
                     raw_payload,
                     signature
@@ -82,6 +133,9 @@ class WebhookService:
         """
         Process a webhook event
 
+        Database connection errors are re-raised so callers can retry;
+        other failures are recorded on the event.
+
         Args:
             webhook_event_id: UUID of the webhook event
 
@@ -104,22 +158,10 @@ class WebhookService:
             return False
 
         try:
-            # Get provider instance
-            provider_instance = get_provider(webhook_event.provider)
-
-            # Handle webhook with provider
-            result = provider_instance.handle_webhook(webhook_event.payload)
-
-            # Extract transaction information
-            provider_transaction_id = result.get('transaction_id')
-            event_type = result.get('event_type')
-            status = result.get('status')
-            additional_data = result.get('additional_data', {})
-
             # Find transaction in our database
-            transaction = Transaction.query.filter_by(
-                provider_transaction_id=provider_transaction_id
-            ).first()
+            provider_transaction_id, transaction = WebhookService._find_transaction(
+                webhook_event.provider, webhook_event.payload
+            )
 
             if not transaction:
                 webhook_event.error_message = f'Transaction not found: {provider_transaction_id}'
@@ -127,19 +169,25 @@ class WebhookService:
                 db.session.commit()
                 return False
 
+            # Handle webhook with the owning merchant's provider configuration
+            provider_instance = get_provider(webhook_event.provider, transaction.merchant_id)
+            result = provider_instance.handle_webhook(webhook_event.payload)
+
+            event_type = result.get('event_type')
+            status = result.get('status')
+            additional_data = result.get('additional_data', {})
+
             # Link webhook to transaction
             webhook_event.transaction_id = transaction.id
 
             # Update transaction status
             old_status = transaction.status
 
-            if status == 'completed':
-                transaction.status = TransactionStatus.COMPLETED
-                transaction.completed_at = datetime.now()
-            elif status == 'failed':
-                transaction.status = TransactionStatus.FAILED
-            elif status == 'refunded':
-                transaction.status = TransactionStatus.REFUNDED
+            new_status = WebhookService.STATUS_TRANSITIONS.get(status)
+            if new_status is not None:
+                transaction.status = new_status
+                if new_status is TransactionStatus.COMPLETED:
+                    transaction.completed_at = db.func.now()
 
             # Update provider response
             if transaction.provider_response:
@@ -149,11 +197,9 @@ class WebhookService:
 
             # Mark webhook as processed
             webhook_event.processed = True
-            webhook_event.processed_at = datetime.now()
-
-            db.session.commit()
+            webhook_event.processed_at = db.func.now()
 
-            # Log audit event
+            # Log audit event in the same commit as the status change
             AuditService.log_event(
                 transaction_id=transaction.id,
                 event_type=event_type,
@@ -162,20 +208,27 @@ class WebhookService:
                     'new_status': transaction.status,
                     'webhook_event_id': str(webhook_event.id),
                     'webhook_data': additional_data
-                }
+                },
+                commit=False
             )
 
-            # s
+            db.session.commit()
 
             return True
 
+        except OperationalError:
+            # Transient database failure: leave the event untouched for a retry
+            db.session.rollback()
+            raise
+
         except Exception as e:
+            # Drop any half-applied transaction update before recording the failure
+            db.session.rollback()
             webhook_event.error_message = str(e)
             webhook_event.retry_count += 1
             db.session.commit()
 
             # Log error
-            import logging
             logging.error(f'Webhook processing failed: {str(e)}')
 
             return False
@@ -194,6 +247,8 @@ class WebhookService:
         ).all()
 
         processed_count = 0
+        # created_at is stamped by the database, so measure against its clock
+        now = db_now()
 
         for webhook in failed_webhooks:
             # Check if enough time has passed for next retry
@@ -203,7 +258,7 @@ class WebhookService:
             else:
                 retry_interval = WebhookService.RETRY_SCHEDULE[webhook.retry_count]
 
-            time_since_creation = (datetime.now() - webhook.created_at).total_seconds()
+            time_since_creation = (now - webhook.created_at).total_seconds()
 
             if time_since_creation >= retry_interval:
                 try:
@@ -211,7 +266,6 @@ class WebhookService:
                     if success:
                         processed_count += 1
                 except Exception as e:
-                    import logging
                     logging.error(f'Retry failed for webhook {webhook.id}: {str(e)}')
 
         return processed_count
@@ -237,9 +291,10 @@ class WebhookService:
             per_page: Items per page
 
         Returns:
-            Paginated webhook events
+            Paginated rows, each holding one webhook event already rendered
+            as JSON text (WebhookEvent.to_dict fields) by Postgres
         """
-        query = WebhookEvent.query
+        query = WebhookEvent.query.with_entities(WebhookService.LIST_JSON)
 
         if provider:
             query = query.filter_by(provider=provider)
@@ -284,7 +339,7 @@ class WebhookService:
 
         if webhook_event:
             webhook_event.processed = True
-            webhook_event.processed_at = datetime.now()
+            webhook_event.processed_at = db.func.now()
             db.session.commit()
 
     @staticmethod
@@ -302,8 +357,6 @@ class WebhookService:
         Returns:
             Dict containing webhook statistics
         """
-        from sqlalchemy import func
-
         query = WebhookEvent.query
 
         if start_date:
@@ -1,18 +1,15 @@
 from typing import Dict, Any, Optional
 
 from app import celery_app
-from app.models import WebhookEvent
-from app.extensions import db
-from app.providers import get_provider
+from app.services.webhook_service import WebhookService
 
 @celery_app.task(name='receive_webhook_task')
 def receive_webhook(
         provider: str,
         payload: Dict[str, Any],
         signature: Optional[str] = None,
-        raw_payload: Optional[bytes] = None,
-        api_key : Optional[str] = None
-) -> WebhookEvent:
+        raw_payload: Optional[bytes] = None
+) -> str:
     """
     Receive and store webhook event
 
@@ -21,42 +18,15 @@ def receive_webhook(
         payload: Webhook payload (parsed JSON)
         signature: Webhook signature from headers
         raw_payload: Raw payload bytes for signature verification
-        api_key: Payment API key
 
     Returns:
-        Created WebhookEvent object
+        ID of the created WebhookEvent
     """
-    # Create webhook event record
-    webhook_event = WebhookEvent(
+    webhook_event = WebhookService.receive_webhook(
         provider=provider,
-        event_type=payload.get('event', payload.get('type', 'unknown')),
         payload=payload,
         signature=signature,
-        verified=False,
-        processed=False
+        raw_payload=raw_payload
     )
 
-    db.session.add(webhook_event)
-    db.session.commit()
-
-    # Verify signature if provided
-    if signature and raw_payload:
-        try:
-            provider_instance = get_provider(provider, api_key)
-            is_valid = provider_instance.verify_webhook_signature(
-                raw_payload,
-                signature
-            )
-
-            webhook_event.verified = is_valid
-            db.session.commit()
-
-        except Exception as e:
-            webhook_event.error_message = f'Signature verification failed: {str(e)}'
-            db.session.commit()
-    else:
-        # No signature verification available
-        webhook_event.verified = True
-        db.session.commit()
-
-    return webhook_event
\ No newline at end of file
+    return str(webhook_event.id)
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from flask import current_app
+
+from app.extensions import celery_app, db
+from app.models import Transaction
+from app.services.payment_service import PaymentService
+
+# Reconciliation is network-bound on the providers, so verify in parallel
+RECONCILE_MAX_WORKERS = 16
+RECONCILE_BATCH_SIZE = 64
+
+
+@celery_app.task(name='reconcile_transactions_task', bind=True)
+def reconcile_transactions(self) -> dict:
+    """
+    Reconcile pending transactions with payment providers
+
+    Verifies the status of all pending or processing transactions and reports
+    progress after every batch.
+
+    Returns:
+        Dict with total_pending, reconciled and per-transaction errors
+    """
+    # Get all pending or processing transactions
+    transaction_ids = [
+        transaction_id for transaction_id, in db.session.query(Transaction.id).filter(
+            Transaction.status.in_(['pending', 'processing'])
+        ).all()
+    ]
+
+    reconciled = 0
+    errors = []
+
+    app = current_app._get_current_object()
+
+    def verify(transaction_id):
+        # Each worker needs its own app context (and so its own DB session)
+        with app.app_context():
+            PaymentService.verify_payment(transaction_id)
+
+    with ThreadPoolExecutor(max_workers=RECONCILE_MAX_WORKERS) as executor:
+        # Submit in batches so a large backlog doesn't flood the providers
+        for start in range(0, len(transaction_ids), RECONCILE_BATCH_SIZE):
+            batch = transaction_ids[start:start + RECONCILE_BATCH_SIZE]
+            futures = {executor.submit(verify, transaction_id): transaction_id for transaction_id in batch}
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    reconciled += 1
+                except Exception as e:
+                    errors.append({
+                        'transaction_id': str(futures[future]),
+                        'error': str(e)
+                    })
+
+            self.update_state(state='PROGRESS', meta={
+                'total_pending': len(transaction_ids),
+                'checked': start + len(batch)
+            })
+
+    return {
+        'total_pending': len(transaction_ids),
+        'reconciled': reconciled,
+        'errors': errors
+    }
@@ -1,9 +1,10 @@
-from datetime import datetime
+import logging
 
 from app import celery_app
 
 from app.models import WebhookEvent
 from app.services.webhook_service import WebhookService
+from app.utils.clock import db_now
 
 
 @celery_app.task(name='retry_failed_webhook_task')
@@ -20,6 +21,8 @@ def retry_failed_webhooks(api_key : str):
         ).all()
 
         processed_count = 0
+        # created_at is stamped by the database, so measure against its clock
+        now = db_now()
 
         for webhook in failed_webhooks:
             # Check if enough time has passed for next retry
@@ -29,7 +32,7 @@ def retry_failed_webhooks(api_key : str):
             else:
                 retry_interval = WebhookService.RETRY_SCHEDULE[webhook.retry_count]
 
-            time_since_creation = (datetime.now() - webhook.created_at).total_seconds()
+            time_since_creation = (now - webhook.created_at).total_seconds()
 
             if time_since_creation >= retry_interval:
                 try:
@@ -37,7 +40,6 @@ def retry_failed_webhooks(api_key : str):
                     if success:
                         processed_count += 1
                 except Exception as e:
-                    import logging
                     logging.error(f'Retry failed for webhook {webhook.id}: {str(e)}')
 
         return processed_count
\ No newline at end of file
@@ -1,35 +1,28 @@
-from functools import wraps
-
-from flask import request
-
-from app.errors import Unauthorized
-
-
-from functools import wraps
 from flask import request, g
+from sqlalchemy import select
 from werkzeug.exceptions import Unauthorized
 
+from app.extensions import db
 from app.models import Account
 
 
-def api_key_required():
-    """Validate merchant API key"""
-
-    def decorator(func):
-        @wraps(func)
-        def decorated_function(*args, **kwargs):
-            api_key = request.headers.get("X-API-Key")
-
-            if not api_key:
-                raise Unauthorized("API key missing")
+def authenticate_api_key():
+    """
+    Validate the merchant API key on the current request
 
-            merchant_key = Account.query.filter_by(_api_key=api_key).first()
+    The key and its merchant id are stored on g.api_key and g.merchant_id.
+    """
+    api_key = request.headers.get("X-API-Key")
 
-            if not merchant_key:
-                raise Unauthorized("Invalid API key")
+    if not api_key:
+        raise Unauthorized("API key missing")
 
-            return func(*args, **kwargs)
+    account = db.session.execute(
+        select(Account.merchant_id).where(Account.api_key_hash == Account.hash_api_key(api_key))
+    ).first()
 
-        return decorated_function
+    if not account:
+        raise Unauthorized("Invalid API key")
 
-    return decorator
\ No newline at end of file
+    g.api_key = api_key
+    g.merchant_id = account.merchant_id
@@ -0,0 +1,24 @@
+"""
+Clock
+Database time for comparisons against server-stamped columns
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from app.extensions import db
+
+
+def db_now() -> datetime:
+    """
+    Current time on the database clock
+
+    created_at/updated_at are stamped by Postgres now() into naive DateTime
+    columns, so anything compared against them must come from the same clock
+    (and session time zone) rather than the app host's datetime.now().
+
+    Returns:
+        Naive datetime, as now() is stored in a timestamp column
+    """
+    return db.session.scalar(select(func.localtimestamp()))
@@ -3,11 +3,13 @@ Custom Decorators
 Rate limiting, authentication, and other decorators
 """
 
+import json
 from functools import wraps
 from flask import request, jsonify, current_app
 from flask_jwt_extended import verify_jwt_in_request, get_jwt
 import time
 from app.extensions import redis_client
+from app.utils.logger import get_logger
 
 
 def rate_limit(max_requests=100, window_seconds=60, key_prefix='rate_limit'):
@@ -148,11 +150,10 @@ def log_execution_time(f):
             return "Success"
     """
 
+    logger = get_logger(__name__)
+
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from app.utils.logger import get_logger
-        logger = get_logger(__name__)
-
         start_time = time.time()
         result = f(*args, **kwargs)
         end_time = time.time()
@@ -189,7 +190,6 @@ def cache_response(ttl=300, key_prefix='cache'):
                 # Try to get cached response
                 cached = redis_client.get(cache_key)
                 if cached:
-                    import json
                     return json.loads(cached)
             except Exception as e:
                 current_app.logger.warning(f'Cache retrieval failed: {str(e)}')
@@ -199,7 +199,6 @@ def cache_response(ttl=300, key_prefix='cache'):
 
             # Cache the result
             try:
-                import json
                 redis_client.set(cache_key, json.dumps(result), ex=ttl)
             except Exception as e:
                 current_app.logger.warning(f'Cache storage failed: {str(e)}')
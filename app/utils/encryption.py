@@ -1,22 +1,36 @@
 import hashlib
 import os
 import base64
+from functools import lru_cache
+
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-def encrypt_response(response: str, merchant_key: str) -> dict:
+
+@lru_cache(maxsize=1024)
+def _merchant_cipher(merchant_key: str) -> AESGCM:
     """
-    Encrypt API response using AES-256-GCM.
+    Build the AES-256-GCM cipher for a merchant key.
 
-    Returns a transport-safe payload the merchant can decrypt.
+    Cached so the key is padded and the cipher set up once per merchant.
     """
 
-    key = str(merchant_key).encode()
+    key = merchant_key.encode()
     if len(key) < 32:
         key = key.ljust(32, b"\0")
     else:
         key = key[:32]
 
-    aesgcm = AESGCM(key)
+    return AESGCM(key)
+
+
+def encrypt_response(response: str, merchant_key: str) -> dict:
+    """
+    Encrypt API response using AES-256-GCM.
+
+    Returns a transport-safe payload the merchant can decrypt.
+    """
+
+    aesgcm = _merchant_cipher(str(merchant_key))
 
     # Generate random IV (12 bytes for GCM)
     iv = os.urandom(12)
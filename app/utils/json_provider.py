@@ -0,0 +1,85 @@
+"""
+JSON Provider
+orjson-backed replacement for Flask's default JSON provider
+"""
+
+import decimal
+from typing import Any, Callable, Iterator
+
+import orjson
+from flask import Response, stream_with_context
+from flask.json.provider import JSONProvider
+
+
+def _default(o: Any) -> Any:
+    """Serialize the types orjson doesn't handle natively, the same way Flask does"""
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes with the same settings as OrjsonProvider"""
+    return orjson.dumps(obj, default=_default, option=OrjsonProvider.option)
+
+
+def stream_page(pagination, serialize: Callable[[Any], Any], encoded: bool = False) -> Response:
+    """
+    Stream a paginated list response item by item
+
+    Produces the same body as jsonify({'success': True, 'data': {'items': [...], 'pagination': {...}}})
+    without holding every serialized item in memory at once.
+
+    Args:
+        pagination: Flask-SQLAlchemy Pagination
+        serialize: Converts one item to a JSON-serializable value
+        encoded: serialize already returns JSON text (e.g. built by Postgres), write it as is
+    """
+    meta = {
+        'page': pagination.page,
+        'per_page': pagination.per_page,
+        'total': pagination.total,
+        'pages': pagination.pages,
+        'has_next': pagination.has_next,
+        'has_prev': pagination.has_prev
+    }
+
+    def generate() -> Iterator[bytes]:
+        yield b'{"success":true,"data":{"items":['
+        for index, item in enumerate(pagination.items):
+            if index:
+                yield b','
+            if encoded:
+                yield serialize(item).encode()
+            else:
+                yield dumps_bytes(serialize(item))
+        yield b'],"pagination":' + dumps_bytes(meta) + b'}}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider using orjson for encoding and decoding
+
+    datetime, UUID, dataclass and Enum values are serialized natively by orjson.
+
+    Usage:
+        app.json = OrjsonProvider(app)
+    """
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype='application/json')
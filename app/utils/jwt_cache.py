@@ -0,0 +1,179 @@
+"""
+JWT Verification Cache
+Caches decoded JWT claims so admin routes skip signature verification on repeat hits
+
+Lookups go through a per-process TTL cache (L1) before Redis (L2). Only the
+signature check is cached: token type, blocklist and custom claim checks run
+on every request, as they do under @jwt_required().
+"""
+
+import hashlib
+import json
+import threading
+import time
+from functools import wraps
+
+from cachetools import TTLCache
+
+from flask import request, g
+from flask_jwt_extended import decode_token, get_unverified_jwt_headers
+from flask_jwt_extended.exceptions import WrongTokenError
+from flask_jwt_extended.internal_utils import (
+    custom_verification_for_token,
+    has_user_lookup,
+    user_lookup,
+    verify_token_not_blocklisted,
+)
+
+from app.errors import Unauthorized
+from app.extensions import redis_client
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound on how long verified claims may be served from Redis
+MAX_CACHE_TTL = 10
+
+# In-process L1 cache, keyed by the first 16 bytes of the token digest
+L1_MAX_ENTRIES = 10_000
+L1_TTL = 5
+
+_L1 = TTLCache(maxsize=L1_MAX_ENTRIES, ttl=L1_TTL)
+_L1_lock = threading.RLock()
+
+
+def _cache_key(token: str) -> str:
+    """Generate Redis key for a token"""
+    return f'jwt:{hashlib.sha256(token.encode()).hexdigest()}'
+
+
+def _l1_key(token: str) -> bytes:
+    """Generate compact in-process key for a token"""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _remember_l1(l1_key: bytes, claims: dict):
+    """Store claims in L1 unless the token expires before the L1 entry would"""
+    if claims.get('exp') and claims['exp'] - time.time() < L1_TTL:
+        return
+
+    with _L1_lock:
+        _L1[l1_key] = claims
+
+
+def _check_claims(token: str, claims: dict) -> dict:
+    """Apply the checks @jwt_required() runs after decoding a token"""
+    if claims.get('type') != 'access':
+        raise WrongTokenError('Only access tokens are allowed')
+
+    jwt_header = get_unverified_jwt_headers(token)
+    verify_token_not_blocklisted(jwt_header, claims)
+    custom_verification_for_token(jwt_header, claims)
+
+    return claims
+
+
+def verify_cached(token: str) -> dict:
+    """
+    Decode and verify a JWT, reusing cached claims when available
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Decoded claims
+
+    Raises:
+        Any flask_jwt_extended / PyJWT error raised while decoding or checking
+        the token (wrong type, revoked, failed claim verification)
+    """
+    l1_key = _l1_key(token)
+
+    with _L1_lock:
+        claims = _L1.get(l1_key)
+    if claims is not None:
+        return _check_claims(token, claims)
+
+    key = _cache_key(token)
+
+    try:
+        cached = redis_client.get(key)
+        if cached:
+            claims = _check_claims(token, json.loads(cached))
+            _remember_l1(l1_key, claims)
+            return claims
+    except Exception as e:
+        logger.warning(f'JWT cache retrieval failed: {str(e)}')
+
+    claims = _check_claims(token, decode_token(token))
+
+    # Never cache past the token's own expiry
+    ttl = MAX_CACHE_TTL
+    if claims.get('exp'):
+        ttl = min(int(claims['exp'] - time.time()), MAX_CACHE_TTL)
+
+    if ttl > 0:
+        _remember_l1(l1_key, claims)
+
+        try:
+            redis_client.set(key, json.dumps(claims), ex=ttl)
+        except Exception as e:
+            logger.warning(f'JWT cache storage failed: {str(e)}')
+
+    return claims
+
+
+def invalidate_token(token: str):
+    """Drop cached claims for a token (e.g. on logout or revocation)"""
+    with _L1_lock:
+        _L1.pop(_l1_key(token), None)
+
+    try:
+        redis_client.delete(_cache_key(token))
+    except Exception as e:
+        logger.warning(f'JWT cache invalidation failed: {str(e)}')
+
+
+def jwt_required_cached():
+    """
+    Drop-in replacement for @jwt_required() backed by the verification cache
+
+    Verified claims are available to the view as g.jwt_claims, and through
+    get_jwt() / get_jwt_identity() as with @jwt_required().
+
+    Usage:
+        @jwt_required_cached()
+        def my_endpoint():
+            return "Success"
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            auth_header = request.headers.get('Authorization', '')
+
+            if not auth_header.startswith('Bearer '):
+                raise Unauthorized('Missing Bearer token')
+
+            token = auth_header[7:]
+
+            try:
+                claims = verify_cached(token)
+            except Exception as e:
+                raise Unauthorized(f'Invalid token: {str(e)}')
+
+            # Fill the request context get_jwt() and friends read from
+            jwt_header = get_unverified_jwt_headers(token)
+            g.jwt_claims = claims
+            g._jwt_extended_jwt = claims
+            g._jwt_extended_jwt_header = jwt_header
+            g._jwt_extended_jwt_user = {
+                'loaded_user': user_lookup(jwt_header, claims) if has_user_lookup() else None
+            }
+            g._jwt_extended_jwt_location = 'headers'
+
+            return f(*args, **kwargs)
+
+        return decorated_function
+
+    return decorator
@@ -0,0 +1,17 @@
+"""
+Celery Worker Entry Point
+
+    celery -A celery_worker.celery_app worker --loglevel=info
+"""
+
+from app import create_app
+from app.extensions import celery_app
+
+# Configures the broker and the app-context task base
+flask_app = create_app()
+
+# Register every task with the worker, not just the ones the blueprints import
+import app.tasks.process_webhook_task  # noqa: E402,F401
+import app.tasks.recieve_webhook_task  # noqa: E402,F401
+import app.tasks.reconcile_transactions_task  # noqa: E402,F401
+import app.tasks.retry_failed_webhooks_task  # noqa: E402,F401
@@ -0,0 +1,20 @@
+"""
+Gunicorn Configuration
+Requests spend most of their time waiting on Postgres, Redis and provider
+HTTP calls, so workers serve them from gevent greenlets.
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', 2))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperative before the worker loads the app"""
+    if worker_class == 'gevent':
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
@@ -0,0 +1,44 @@
+"""
+Backfill Account.api_key_hash
+
+Accounts created before api_key_hash existed have it NULL, and API-key
+authentication only looks keys up by their hash. Run once per database
+before (or right after) deploying:
+
+    python -m scripts.backfill_api_key_hash
+
+Safe to re-run.
+"""
+
+from sqlalchemy import text
+
+from app import create_app
+from app.extensions import db
+
+STATEMENTS = (
+    'ALTER TABLE account ADD COLUMN IF NOT EXISTS api_key_hash BYTEA',
+    # Same digest as Account.hash_api_key: sha256 of the UTF-8 key
+    "UPDATE account SET api_key_hash = sha256(convert_to(api_key, 'UTF8')) "
+    'WHERE api_key_hash IS NULL AND api_key IS NOT NULL',
+    'CREATE UNIQUE INDEX IF NOT EXISTS ix_account_api_key_hash ON account (api_key_hash) INCLUDE (merchant_id)',
+    # Lookups no longer use the raw key
+    'DROP INDEX IF EXISTS ix_account_api_key',
+)
+
+
+def backfill() -> int:
+    """Add, fill and index api_key_hash; returns the number of accounts updated"""
+    updated = 0
+
+    with db.engine.begin() as connection:
+        for statement in STATEMENTS:
+            result = connection.execute(text(statement))
+            if statement.startswith('UPDATE'):
+                updated = result.rowcount
+
+    return updated
+
+
+if __name__ == '__main__':
+    with create_app().app_context():
+        print(f'Backfilled api_key_hash for {backfill()} accounts')
@@ -0,0 +1,57 @@
+"""
+Backfill merchant_id on provider configs and transactions
+
+Provider configs and transactions are now resolved per merchant, but
+db.create_all() never alters existing tables, so databases created earlier
+have no merchant_id columns. Run once per database before deploying:
+
+    python -m scripts.backfill_merchant_ids
+
+Existing rows are assigned to the merchant only when the database has exactly
+one; otherwise they are left NULL and reported so they can be assigned by
+hand. provider_merchant_config.merchant_id becomes NOT NULL once no NULLs
+remain. Safe to re-run.
+"""
+
+from sqlalchemy import text
+
+from app import create_app
+from app.extensions import db
+
+STATEMENTS = (
+    'ALTER TABLE provider_merchant_config ADD COLUMN IF NOT EXISTS merchant_id UUID REFERENCES merchant (id)',
+    'ALTER TABLE transactions ADD COLUMN IF NOT EXISTS merchant_id UUID REFERENCES merchant (id)',
+    # Single-tenant databases: everything already belongs to the one merchant
+    'UPDATE provider_merchant_config SET merchant_id = (SELECT id FROM merchant LIMIT 1) '
+    'WHERE merchant_id IS NULL AND (SELECT count(*) FROM merchant) = 1',
+    'UPDATE transactions SET merchant_id = (SELECT id FROM merchant LIMIT 1) '
+    'WHERE merchant_id IS NULL AND (SELECT count(*) FROM merchant) = 1',
+    'CREATE UNIQUE INDEX IF NOT EXISTS ix_provider_config_merchant_provider '
+    'ON provider_merchant_config (merchant_id, provider_id)',
+)
+
+
+def backfill() -> dict:
+    """Add and fill the merchant_id columns; returns rows still missing a merchant per table"""
+    with db.engine.begin() as connection:
+        for statement in STATEMENTS:
+            connection.execute(text(statement))
+
+        missing = {
+            table: connection.execute(text(f'SELECT count(*) FROM {table} WHERE merchant_id IS NULL')).scalar()
+            for table in ('provider_merchant_config', 'transactions')
+        }
+
+        if not missing['provider_merchant_config']:
+            connection.execute(text('ALTER TABLE provider_merchant_config ALTER COLUMN merchant_id SET NOT NULL'))
+
+    return missing
+
+
+if __name__ == '__main__':
+    with create_app().app_context():
+        for table, count in backfill().items():
+            if count:
+                print(f'{table}: {count} rows have no merchant_id; assign them before deploying')
+            else:
+                print(f'{table}: merchant_id backfilled')
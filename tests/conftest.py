@@ -8,6 +8,7 @@ import pytest
 import os
 from app import create_app
 from app.extensions import db as _db
+from app.services import idempotency_service
 from app.models import Transaction, WebhookEvent
 
 
@@ -70,6 +71,7 @@ def redis_client():
         yield fake_redis
 
     fake_redis.flushall()
+    idempotency_service._L1.clear()
 
 @pytest.fixture(scope='function')
 def client(app):
@@ -91,7 +93,7 @@ def sample_transaction(session):
         customer_name='Test User',
         payment_method='mpesa',
         status='pending',
-        metadata={'order_id': 'ORD-123'}
+        extra={'order_id': 'ORD-123'}
     )
 
     session.add(transaction)
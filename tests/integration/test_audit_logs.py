@@ -0,0 +1,38 @@
+"""
+Integration Tests for Audit Log Pagination
+"""
+
+from datetime import datetime
+
+from app.models import AuditLog
+from app.services.audit_service import AuditService
+
+
+class TestAuditLogKeysetPagination:
+    """Integration tests for get_audit_logs_after"""
+
+    def test_same_timestamp_paged_by_id(self, session, sample_transaction):
+        """Test rows sharing a timestamp are split across pages by id without gaps or repeats"""
+        timestamp = datetime(2024, 5, 1, 12, 0, 0)
+        for i in range(5):
+            session.add(AuditLog(
+                transaction_id=sample_transaction.id,
+                event_type=f'test.event.{i}',
+                timestamp=timestamp
+            ))
+        session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            logs, cursor = AuditService.get_audit_logs_after(
+                cursor=cursor,
+                transaction_id=sample_transaction.id,
+                per_page=2
+            )
+            seen.extend(log.id for log in logs)
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert seen == sorted(seen, reverse=True)
@@ -0,0 +1,46 @@
+"""
+Unit Tests for Audit Log Keyset Pagination
+"""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app.services.audit_service import AuditService
+from app.utils import jwt_cache
+
+
+class TestAuditCursor:
+    """Test cases for encode_cursor and decode_cursor"""
+
+    def test_round_trip(self):
+        """Test a cursor decodes back to the row's (timestamp, id)"""
+        row = SimpleNamespace(timestamp=datetime(2024, 5, 1, 12, 30, 15, 123456), id=uuid.uuid4())
+
+        cursor = AuditService.encode_cursor(row)
+
+        assert AuditService.decode_cursor(cursor) == (row.timestamp, row.id)
+
+    @pytest.mark.parametrize('cursor', ['not-a-cursor', '', 'MjAyNC0wNS0wMQ=='])
+    def test_malformed_cursor_rejected(self, cursor):
+        """Test malformed cursors raise ValueError"""
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            AuditService.decode_cursor(cursor)
+
+    def test_malformed_cursor_returns_400(self, app, client):
+        """Test the audit log endpoint rejects a malformed cursor"""
+        with patch('app.utils.jwt_cache.redis_client', fakeredis.FakeStrictRedis(decode_responses=True)):
+            token = create_access_token(identity='admin')
+            response = client.get(
+                '/api/v1/admin/audit-logs?cursor=not-a-cursor',
+                headers={'Authorization': f'Bearer {token}'}
+            )
+        jwt_cache._L1.clear()
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid cursor'
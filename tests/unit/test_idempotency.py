@@ -5,6 +5,7 @@ Unit Tests for Idempotency Service
 import pytest
 import json
 from unittest.mock import Mock, patch
+from app.services import idempotency_service
 from app.services.idempotency_service import IdempotencyService
 
 
@@ -68,6 +69,28 @@ class TestIdempotencyService:
         # Should be expired
         assert IdempotencyService.get_cached_response('test-key') is None
 
+    def test_cached_response_served_from_memory(self, redis_client):
+        """Test repeat lookups skip Redis while the in-process entry is fresh"""
+        IdempotencyService.cache_response('memory-key', {'status': 'success'}, ttl=60)
+
+        with patch.object(redis_client, 'get') as mock_get:
+            cached = IdempotencyService.get_cached_response('memory-key')
+
+        mock_get.assert_not_called()
+        assert cached['status'] == 'success'
+
+    def test_delete_elsewhere_expires_from_memory(self, redis_client):
+        """Test a key deleted by another process stops being served within L1_TTL"""
+        IdempotencyService.cache_response('memory-key', {'status': 'success'}, ttl=60)
+
+        # Simulate another worker deleting the key: only Redis is cleared
+        redis_client.delete(IdempotencyService.get_key('memory-key'))
+
+        import time
+        time.sleep(idempotency_service.L1_TTL + 0.1)
+
+        assert IdempotencyService.get_cached_response('memory-key') is None
+
     def test_cache_complex_data(self, redis_client):
         """Test caching complex nested data"""
         complex_data = {
@@ -0,0 +1,35 @@
+"""
+Unit Tests for Identifier Helpers
+"""
+
+import time
+import uuid
+
+from app.utils.ids import uuid7
+
+
+class TestUuid7:
+    """Test cases for uuid7"""
+
+    def test_version_and_variant(self):
+        """Test generated values are RFC 9562 version 7 UUIDs"""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_time_ordered(self):
+        """Test keys generated later sort after earlier ones"""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+    def test_embeds_current_time(self):
+        """Test the leading 48 bits hold the Unix time in milliseconds"""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
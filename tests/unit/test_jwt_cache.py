@@ -0,0 +1,104 @@
+"""
+Unit Tests for JWT Verification Cache
+"""
+
+import pytest
+from unittest.mock import patch
+
+import fakeredis
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity
+from flask_jwt_extended.exceptions import RevokedTokenError, WrongTokenError
+
+from app.extensions import jwt
+from app.utils import jwt_cache
+
+
+@pytest.fixture
+def jwt_redis():
+    """Fake Redis patched into the JWT cache"""
+    fake_redis = fakeredis.FakeStrictRedis(decode_responses=True)
+
+    with patch("app.utils.jwt_cache.redis_client", fake_redis):
+        yield fake_redis
+
+    fake_redis.flushall()
+    jwt_cache._L1.clear()
+
+
+class TestVerifyCached:
+    """Test cases for verify_cached"""
+
+    def test_miss_decodes_and_caches(self, app, jwt_redis):
+        """Test first verification stores claims with a bounded TTL"""
+        token = create_access_token(identity='admin')
+
+        claims = jwt_cache.verify_cached(token)
+
+        key = jwt_cache._cache_key(token)
+        assert claims['sub'] == 'admin'
+        assert jwt_redis.get(key) is not None
+        assert 0 < jwt_redis.ttl(key) <= jwt_cache.MAX_CACHE_TTL
+
+    def test_hit_skips_decode(self, app, jwt_redis):
+        """Test cached claims are returned without re-verifying"""
+        token = create_access_token(identity='admin')
+        jwt_cache.verify_cached(token)
+
+        with patch('app.utils.jwt_cache.decode_token') as mock_decode:
+            claims = jwt_cache.verify_cached(token)
+
+        mock_decode.assert_not_called()
+        assert claims['sub'] == 'admin'
+
+    def test_invalidate_token(self, app, jwt_redis):
+        """Test invalidation removes cached claims"""
+        token = create_access_token(identity='admin')
+        jwt_cache.verify_cached(token)
+
+        jwt_cache.invalidate_token(token)
+
+        assert jwt_redis.get(jwt_cache._cache_key(token)) is None
+
+    def test_l1_hit_skips_redis(self, app, jwt_redis):
+        """Test in-process cache answers before Redis"""
+        token = create_access_token(identity='admin')
+        jwt_cache.verify_cached(token)
+
+        with patch.object(jwt_redis, 'get') as mock_get:
+            claims = jwt_cache.verify_cached(token)
+
+        mock_get.assert_not_called()
+        assert claims['sub'] == 'admin'
+
+    def test_refresh_token_rejected(self, app, jwt_redis):
+        """Test refresh tokens are not accepted as access tokens"""
+        token = create_refresh_token(identity='admin')
+
+        with pytest.raises(WrongTokenError):
+            jwt_cache.verify_cached(token)
+
+        assert jwt_redis.get(jwt_cache._cache_key(token)) is None
+
+    def test_revoked_token_rejected_on_cache_hit(self, app, jwt_redis):
+        """Test the blocklist callback runs even when claims are cached"""
+        token = create_access_token(identity='admin')
+        jwt_cache.verify_cached(token)
+
+        with patch.object(jwt, '_token_in_blocklist_callback', return_value=True):
+            with pytest.raises(RevokedTokenError):
+                jwt_cache.verify_cached(token)
+
+
+class TestJwtRequiredCached:
+    """Test cases for the jwt_required_cached decorator"""
+
+    def test_fills_flask_jwt_extended_context(self, app, jwt_redis):
+        """Test get_jwt_identity() works inside a decorated view"""
+        token = create_access_token(identity='admin')
+
+        @jwt_cache.jwt_required_cached()
+        def view():
+            return get_jwt_identity()
+
+        with app.test_request_context(headers={'Authorization': f'Bearer {token}'}):
+            assert view() == 'admin'
@@ -0,0 +1,44 @@
+"""
+Unit Tests for Payment Schemas
+"""
+
+import pytest
+from marshmallow import ValidationError
+
+from app.models import Transaction, TransactionStatus
+from app.schemas.payment_schema import InitializePaymentSchema, TransactionSchema
+
+
+class TestInitializePaymentSchema:
+    """Test cases for InitializePaymentSchema"""
+
+    def _payload(self, provider):
+        return {
+            'provider': provider,
+            'amount': '100.00',
+            'currency': 'ZAR',
+            'customer': {'phone': '+27820000000'}
+        }
+
+    def test_registered_provider_accepted(self):
+        """Test the registry name is accepted exactly as registered"""
+        data = InitializePaymentSchema().load(self._payload('StandardBankPay'))
+
+        assert data['provider'] == 'StandardBankPay'
+
+    def test_unknown_provider_rejected(self):
+        """Test names outside the registry are rejected"""
+        with pytest.raises(ValidationError):
+            InitializePaymentSchema().load(self._payload('standardbankpay'))
+
+
+class TestTransactionSchema:
+    """Test cases for TransactionSchema"""
+
+    def test_status_dumped_as_value(self):
+        """Test the status enum is serialized as its plain string value"""
+        transaction = Transaction(status=TransactionStatus.COMPLETED)
+
+        data = TransactionSchema().dump(transaction)
+
+        assert data['status'] == 'completed'
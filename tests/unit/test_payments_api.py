@@ -0,0 +1,26 @@
+"""
+Unit Tests for Payment API Endpoints
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.payment_service import PaymentService
+
+
+class TestListPayments:
+    """Test cases for GET /api/v1/payments/payments"""
+
+    def test_unknown_status_rejected_by_service(self, app):
+        """Test unknown statuses fail before reaching the database"""
+        with pytest.raises(ValueError):
+            PaymentService.list_transactions(status='foo')
+
+    @patch('app.api.payments.authenticate_api_key')
+    def test_unknown_status_returns_400(self, mock_auth, client):
+        """Test the listing endpoint answers 400 for an unknown status"""
+        response = client.get('/api/v1/payments/payments?status=foo')
+
+        assert response.status_code == 400
+        assert response.json['success'] is False
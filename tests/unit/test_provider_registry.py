@@ -0,0 +1,41 @@
+"""
+Unit Tests for Provider Registry
+"""
+
+import uuid
+from unittest.mock import patch
+
+import app.providers as providers
+from app.providers import invalidate_provider_config
+
+
+class TestProviderConfigCache:
+    """Test cases for the merchant provider config cache"""
+
+    def test_cached_config_skips_query(self, app):
+        """Test a cached config builds the provider without touching the database"""
+        merchant_id = uuid.uuid4()
+        providers._config_cache[('StandardBankPay', merchant_id)] = {
+            'base_url': 'http://127.0.0.1:5000/api/v1',
+            'api_key': 'key',
+            'client_id': 'client'
+        }
+
+        with patch.object(providers.db.session, 'execute') as mock_execute:
+            provider = providers.get_provider('StandardBankPay', merchant_id)
+
+        mock_execute.assert_not_called()
+        assert provider.api_key == 'key'
+        invalidate_provider_config(merchant_id)
+
+    def test_invalidate_provider_config(self):
+        """Test invalidation drops only the given merchant's entries"""
+        merchant_id, other_id = uuid.uuid4(), uuid.uuid4()
+        providers._config_cache[('StandardBankPay', merchant_id)] = {'api_key': 'old'}
+        providers._config_cache[('StandardBankPay', other_id)] = {'api_key': 'other'}
+
+        invalidate_provider_config(merchant_id)
+
+        assert ('StandardBankPay', merchant_id) not in providers._config_cache
+        assert ('StandardBankPay', other_id) in providers._config_cache
+        invalidate_provider_config(other_id)
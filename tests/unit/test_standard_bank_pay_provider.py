@@ -1,3 +1,4 @@
+import orjson
 import pytest
 from unittest.mock import patch, Mock
 from app.providers.standard_bank_pay_provider import StandardBankPayProvider, PaymentInitializationError
@@ -15,12 +16,12 @@ class TestStandardBankPayProvider:
         }
         return StandardBankPayProvider(config)
 
-    @patch('requests.post')
+    @patch('app.providers.standard_bank_pay_provider._session.post')
     def test_initialize_payment_success(self, mock_post, provider):
         """Test successful payment initialization"""
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "sbp_txn_ref": "txn_12345",
             "processing_state": "AWAITING_CUSTOMER",
             "approval_url": "http://localhost:5050/__simulate__/webhook/txn_12345",
@@ -28,7 +29,7 @@ class TestStandardBankPayProvider:
             "meta": {
                 "risk_score": "LOW"
             }
-        }
+        })
         mock_post.return_value = mock_response
 
         result = provider.initialize_payment(
@@ -45,17 +46,17 @@ class TestStandardBankPayProvider:
 
         mock_post.assert_called_once_with(
             f"{provider.base_url}/api/v1/payments/initiate",
-            json={
+            data=orjson.dumps({
                 "amount_cents": 10000,
                 "currency": "ZAR",
                 "customer": {"msisdn": "+27820000000"},
                 "callback_url": None,
-            },
+            }),
             headers=provider._headers("req_abc123"),
             timeout=provider.timeout,
         )
 
-    @patch('requests.post')
+    @patch('app.providers.standard_bank_pay_provider._session.post')
     def test_initialize_payment_api_error(self, mock_post, provider):
         """Test handling of API error during payment initialization"""
         mock_response = Mock()
@@ -71,7 +72,7 @@ class TestStandardBankPayProvider:
                 metadata={"request_id": "req_abc123"}
             )
 
-    @patch('requests.post')
+    @patch('app.providers.standard_bank_pay_provider._session.post')
     def test_initialize_payment_exceeds_limit(self, mock_post, provider):
         """Test that amounts over 100,000 cents are rejected with 422"""
         mock_response = Mock()
@@ -95,4 +96,10 @@ class TestStandardBankPayProvider:
                 currency="ZAR",
                 customer_data={"msisdn": "+27820000000"},
                 metadata={}
-            )
\ No newline at end of file
+            )
+
+    def test_webhook_transaction_id(self):
+        """Test the transaction reference is read without a configured instance"""
+        payload = {"event_type": "PAYMENT_SETTLED", "sbp_txn_ref": "txn_12345"}
+
+        assert StandardBankPayProvider.webhook_transaction_id(payload) == "txn_12345"
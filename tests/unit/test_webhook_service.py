@@ -0,0 +1,38 @@
+"""
+Unit Tests for Webhook Processing
+"""
+
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.webhook_service import WebhookService
+from app.tasks.process_webhook_task import process_webhook
+
+
+class TestProcessWebhook:
+    """Test cases for WebhookService.process_webhook and its Celery task"""
+
+    @patch('app.services.webhook_service.WebhookService._find_transaction')
+    @patch('app.services.webhook_service.WebhookEvent')
+    def test_database_errors_propagate(self, mock_event_model, mock_find, app):
+        """Test transient database errors are re-raised so the task retries"""
+        event = Mock(processed=False, verified=True, retry_count=0)
+        mock_event_model.query.get.return_value = event
+        mock_find.side_effect = OperationalError('SELECT 1', {}, Exception('connection lost'))
+
+        with pytest.raises(OperationalError):
+            WebhookService.process_webhook(uuid.uuid4())
+
+        assert event.retry_count == 0
+
+    @patch('app.tasks.process_webhook_task.WebhookService.process_webhook')
+    def test_task_delegates_to_service(self, mock_process):
+        """Test the task runs the service method with the parsed event id"""
+        event_id = uuid.uuid4()
+        mock_process.return_value = True
+
+        assert process_webhook.run(str(event_id)) is True
+        mock_process.assert_called_once_with(event_id)
@@ -0,0 +1,21 @@
+"""
+Unit Tests for Webhook API Endpoints
+"""
+
+
+class TestReceiveWebhook:
+    """Test cases for POST /api/v1/webhooks/<provider>"""
+
+    def test_unknown_provider_rejected(self, client):
+        """Test unknown providers are rejected before any work is done"""
+        response = client.post('/api/v1/webhooks/unknown', data=b'{}')
+
+        assert response.status_code == 404
+        assert response.json['success'] is False
+
+    def test_invalid_json_rejected(self, client):
+        """Test malformed payloads are rejected"""
+        response = client.post('/api/v1/webhooks/cpay', data=b'{not json')
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'Invalid JSON payload'